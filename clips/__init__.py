@@ -49,7 +49,6 @@ __all__ = ('CLIPSError',
            'ClassDefaultMode',
            'TemplateSlotDefaultType',
            'Symbol',
-           'InstanceName',
            'SaveMode')
 
 
@@ -35,10 +35,10 @@
 
 """
 
-import clips
-
 from clips.modules import Module
-from clips.common import environment_builder
+from clips.values import clips_value, python_value
+from clips.common import environment_builder, environment_data
+from clips.common import environment_changed, ENVIRONMENT_DATA
 from clips.common import CLIPSError, Strategy, SalienceEvaluation, Verbosity
 
 from clips._clips import lib, ffi
@@ -51,41 +51,80 @@ class Rule:
 
     """
 
-    __slots__ = '_env', '_name'
+    __slots__ = '_env', '_name', '_name_str', '_rule', '_epoch', '_pp'
 
     def __init__(self, env: ffi.CData, name: str):
         self._env = env
         self._name = name.encode()
+        self._name_str = name
+        self._rule = ffi.NULL
+        self._epoch = None
+        self._pp = None
+
+    @classmethod
+    def _from_ptr(cls, env: ffi.CData, name: bytes, rule: ffi.CData) -> 'Rule':
+        """Build the Rule from its encoded name priming its pointer cache."""
+        obj = cls.__new__(cls)
+        obj._env = env
+        obj._name = name
+        obj._name_str = None
+        obj._rule = rule
+        obj._epoch = environment_data(env, 'epoch')
+        obj._pp = None
+
+        return obj
 
     def __hash__(self):
         return hash(self._ptr())
 
     def __eq__(self, rule):
+        if self is rule:
+            return True
+        if not isinstance(rule, Rule):
+            return NotImplemented
+
         return self._ptr() == rule._ptr()
 
     def __str__(self):
-        string = lib.DefrulePPForm(self._ptr())
-        string = ffi.string(string).decode() if string != ffi.NULL else ''
-
-        return ' '.join(string.split())
+        return self._pp_string()
 
     def __repr__(self):
-        string = lib.DefrulePPForm(self._ptr())
-        string = ffi.string(string).decode() if string != ffi.NULL else ''
-
-        return "%s: %s" % (self.__class__.__name__, ' '.join(string.split()))
+        return "%s: %s" % (self.__class__.__name__, self._pp_string())
 
     def _ptr(self) -> ffi.CData:
-        rule = lib.FindDefrule(self._env, self._name)
-        if rule == ffi.NULL:
-            raise CLIPSError(self._env, 'Rule <%s> not defined' % self.name)
+        epoch = environment_data(self._env, 'epoch')
+
+        if self._epoch != epoch:
+            rule = lib.FindDefrule(self._env, self._name)
+            if rule == ffi.NULL:
+                raise CLIPSError(
+                    self._env, 'Rule <%s> not defined' % self.name)
+
+            self._rule = rule
+            self._epoch = epoch
+            self._pp = None
+
+        return self._rule
+
+    def _pp_string(self) -> str:
+        """The Rule PP form, cached as long as the Rule pointer is."""
+        rule = self._ptr()
+
+        if self._pp is None:
+            string = lib.DefrulePPForm(rule)
+            string = ffi.string(string).decode() if string != ffi.NULL else ''
+
+            self._pp = ' '.join(string.split())
 
-        return rule
+        return self._pp
 
     @property
     def name(self) -> str:
         """Rule name."""
-        return self._name.decode()
+        if self._name_str is None:
+            self._name_str = self._name.decode()
+
+        return self._name_str
 
     @property
     def module(self) -> Module:
@@ -137,11 +176,11 @@ class Rule:
           * Verbosity.TERSE: (default) nothing is printed to stdout
 
         """
-        value = clips.values.clips_value(self._env)
+        value = clips_value(self._env)
 
         lib.Matches(self._ptr(), verbosity, value)
 
-        return clips.values.python_value(self._env, value)
+        return python_value(self._env, value)
 
     def refresh(self):
         """Refresh the Rule.
@@ -150,6 +189,7 @@ class Rule:
 
         """
         lib.Refresh(self._ptr())
+        environment_changed(self._env)
 
     def add_breakpoint(self):
         """Add a breakpoint for the Rule.
@@ -176,7 +216,9 @@ class Rule:
         The object becomes unusable after this method has been called.
 
         """
-        if not lib.Undefrule(self._ptr(), self._env):
+        ret = lib.Undefrule(self._ptr(), self._env)
+        environment_changed(self._env)
+        if not ret:
             raise CLIPSError(self._env)
 
 
@@ -188,6 +230,8 @@ class Activation:
 
     """
 
+    __slots__ = '_env', '_act', '_pp', '_rule_name'
+
     def __init__(self, env: ffi.CData, act: ffi.CData):
         self._env = env
         self._act = act
@@ -198,6 +242,11 @@ class Activation:
         return hash(self._act)
 
     def __eq__(self, act):
+        if self is act:
+            return True
+        if not isinstance(act, Activation):
+            return NotImplemented
+
         return self._act == act._act
 
     def __str__(self):
@@ -208,17 +257,10 @@ class Activation:
 
     def _assert_is_active(self):
         """As the engine does not provide means to find activations,
-        the existence of the pointer in the activations list is tested instead.
+        the existence of the pointer in the activations set is tested instead.
 
         """
-        activations = []
-        activation = lib.GetNextActivation(self._env, ffi.NULL)
-
-        while activation != ffi.NULL:
-            activations.append(activation)
-            activation = lib.GetNextActivation(self._env, activation)
-
-        if self._act not in activations:
+        if self._act not in agenda_activations(self._env):
             raise CLIPSError(
                 self._env, "Activation %s not in the agenda" % self.name)
 
@@ -258,14 +300,21 @@ class Agenda:
 
     """
 
+    __slots__ = '_env',
+
     def __init__(self, env: ffi.CData):
         self._env = env
 
     @property
     def agenda_changed(self) -> bool:
         """True if any rule activation changes have occurred."""
-        value = lib.GetAgendaChanged(self._env)
+        data = ENVIRONMENT_DATA[self._env]
+        value = lib.GetAgendaChanged(self._env) or data.agenda_changed
+
         lib.SetAgendaChanged(self._env, False)
+        data.agenda_changed = False
+        if value:
+            data.activations = None
 
         return value
 
@@ -291,7 +340,8 @@ class Agenda:
         Equivalent to the CLIPS (get-focus) function.
 
         """
-        return lib.Focus(module._ptr())
+        lib.Focus(module._ptr())
+        environment_changed(self._env)
 
     @property
     def strategy(self) -> Strategy:
@@ -300,7 +350,7 @@ class Agenda:
         Equivalent to the CLIPS (get-strategy) function.
 
         """
-        return Strategy(lib.GetStrategy(self._env))
+        return STRATEGIES[lib.GetStrategy(self._env)]
 
     @strategy.setter
     def strategy(self, value: Strategy):
@@ -309,7 +359,10 @@ class Agenda:
         Equivalent to the CLIPS (get-strategy) function.
 
         """
-        lib.SetStrategy(self._env, Strategy(value))
+        if not isinstance(value, Strategy):
+            value = Strategy(value)
+
+        lib.SetStrategy(self._env, value)
 
     @property
     def salience_evaluation(self) -> SalienceEvaluation:
@@ -318,7 +371,7 @@ class Agenda:
         Equivalent to the CLIPS (get-salience-evaluation) command.
 
         """
-        return SalienceEvaluation(lib.GetSalienceEvaluation(self._env))
+        return SALIENCE_EVALUATIONS[lib.GetSalienceEvaluation(self._env)]
 
     @salience_evaluation.setter
     def salience_evaluation(self, value: SalienceEvaluation):
@@ -327,25 +380,31 @@ class Agenda:
         Equivalent to the CLIPS (get-salience-evaluation) command.
 
         """
-        lib.SetSalienceEvaluation(self._env, SalienceEvaluation(value))
+        if not isinstance(value, SalienceEvaluation):
+            value = SalienceEvaluation(value)
+
+        lib.SetSalienceEvaluation(self._env, value)
 
     def rules(self) -> iter:
         """Iterate over the defined Rules."""
-        rule = lib.GetNextDefrule(self._env, ffi.NULL)
+        size = lib.CollectDefrules(self._env, ffi.NULL, ffi.NULL, 0)
+        rules = ffi.new('Defrule *[]', size)
+        names = ffi.new('const char *[]', size)
 
-        while rule != ffi.NULL:
-            name = ffi.string(lib.DefruleName(rule)).decode()
-            yield Rule(self._env, name)
+        lib.CollectDefrules(self._env, rules, names, size)
 
-            rule = lib.GetNextDefrule(self._env, rule)
+        return iter([Rule._from_ptr(self._env, ffi.string(n), r)
+                     for r, n in zip(rules, names)])
 
     def find_rule(self, name: str) -> Rule:
         """Find a Rule by name."""
-        defrule = lib.FindDefrule(self._env, name.encode())
+        encoded = name.encode()
+
+        defrule = lib.FindDefrule(self._env, encoded)
         if defrule == ffi.NULL:
             raise LookupError("Rule '%s' not found" % name)
 
-        return Rule(self._env, name)
+        return Rule._from_ptr(self._env, encoded, defrule)
 
     def reorder(self, module: Module = None):
         """Reorder the Activations in the Agenda.
@@ -374,14 +433,12 @@ class Agenda:
         else:
             lib.RefreshAllAgendas(self._env)
 
+        environment_changed(self._env)
+
     def activations(self) -> iter:
         """Iterate over the Activations in the Agenda."""
-        activation = lib.GetNextActivation(self._env, ffi.NULL)
-
-        while activation != ffi.NULL:
-            yield Activation(self._env, activation)
-
-            activation = lib.GetNextActivation(self._env, activation)
+        return iter([Activation(self._env, a)
+                     for a in activation_pointers(self._env)])
 
     def delete_activations(self):
         """Delete all activations in the agenda."""
@@ -404,7 +461,44 @@ class Agenda:
         Returns the number of activation which were run.
 
         """
-        return lib.Run(self._env, limit if limit is not None else -1)
+        ret = lib.Run(self._env, limit if limit is not None else -1)
+        environment_changed(self._env)
+
+        return ret
+
+
+def agenda_activations(env: ffi.CData) -> set:
+    """Return the set of Activations currently within the Agenda.
+
+    The set is rebuilt only if the Agenda or the current Module changed
+    since it was last computed.
+    The CLIPS agenda changed flag is consumed in the process,
+    its value is retained for the Agenda.agenda_changed property.
+
+    """
+    data = ENVIRONMENT_DATA[env]
+    module = lib.GetCurrentModule(env)
+
+    if lib.GetAgendaChanged(env):
+        lib.SetAgendaChanged(env, False)
+        data.agenda_changed = True
+        data.activations = None
+
+    if data.activations is None or data.activations_module != module:
+        data.activations = set(activation_pointers(env))
+        data.activations_module = module
+
+    return data.activations
+
+
+def activation_pointers(env: ffi.CData) -> ffi.CData:
+    """Return an array with the Activations within the Agenda."""
+    size = lib.CollectActivations(env, ffi.NULL, 0)
+    activations = ffi.new('Activation *[]', size)
+
+    lib.CollectActivations(env, activations, size)
+
+    return activations
 
 
 def activation_pp_string(env: ffi.CData, ist: ffi.CData) -> str:
@@ -412,4 +506,8 @@ def activation_pp_string(env: ffi.CData, ist: ffi.CData) -> str:
     lib.SBReset(builder)
     lib.ActivationPPForm(ist, builder)
 
-    return ffi.string(builder.contents).decode()
+    return ffi.unpack(builder.contents, builder.length).decode()
+
+
+STRATEGIES = {s.value: s for s in Strategy}
+SALIENCE_EVALUATIONS = {s.value: s for s in SalienceEvaluation}
@@ -43,9 +43,11 @@ import os
 import clips
 
 from clips.modules import Module
-from clips.common import PutSlotError, PUT_SLOT_ERROR
+from clips.common import PUT_SLOT_ERROR
 from clips.common import CLIPSError, SaveMode, ClassDefaultMode
 from clips.common import environment_builder, environment_modifier
+from clips.common import environment_data, environment_changed
+from clips.common import ENVIRONMENT_DATA
 
 from clips._clips import lib, ffi
 
@@ -65,36 +67,45 @@ class Instance:
 
     def __init__(self, env: ffi.CData, ist: ffi.CData):
         self._env = env
-        self._ist = ist
-        lib.RetainInstance(self._ist)
+        lib.RetainInstance(ist)
+        self._ist = ffi.gc(ist, environment_data(env, 'release_instance'))
 
-    def __del__(self):
-        try:
-            lib.ReleaseInstance(self._ist)
-        except (AttributeError, TypeError):
-            pass  # mostly happening during interpreter shutdown
+    @classmethod
+    def _from_retained(cls, env: ffi.CData, ist: ffi.CData) -> 'Instance':
+        """Wrap an Instance pointer which was already retained in C."""
+        obj = cls.__new__(cls)
+        obj._env = env
+        obj._ist = ffi.gc(ist, environment_data(env, 'release_instance'))
+
+        return obj
 
     def __hash__(self):
         return hash(self._ist)
 
     def __eq__(self, ist):
+        if self is ist:
+            return True
+        if not isinstance(ist, Instance):
+            return NotImplemented
+
         return self._ist == ist._ist
 
     def __str__(self):
-        return ' '.join(instance_pp_string(self._env, self._ist).split())
+        return self._pp_string()
 
     def __repr__(self):
-        string = ' '.join(instance_pp_string(self._env, self._ist).split())
+        return "%s: %s" % (self.__class__.__name__, self._pp_string())
 
-        return "%s: %s" % (self.__class__.__name__, string)
+    def _pp_string(self) -> str:
+        return ' '.join(instance_pp_string(self._env, self._ist).split())
 
     def __iter__(self):
-        slot_names = (s.name for s in self.instance_class.slots())
+        names = class_slots(self._env, lib.InstanceClass(self._ist), False)
 
-        return ((n, slot_value(self._env, self._ist, n)) for n in slot_names)
+        return ((n, slot_value(self._env, self._ist, s)) for n, s in names)
 
     def __getitem__(self, slot):
-        return slot_value(self._env, self._ist, slot)
+        return slot_value(self._env, self._ist, slot.encode())
 
     @property
     def name(self) -> str:
@@ -122,14 +133,19 @@ class Instance:
         if ret != lib.IME_NO_ERROR:
             raise CLIPSError(self._env, code=ret)
 
+        value = environment_data(self._env, 'value')
+
         for slot, slot_val in slots.items():
-            value = clips.values.clips_value(self._env, value=slot_val)
+            clips.values.clips_value(
+                self._env, value=slot_val, clips_val=value)
 
-            ret = lib.IMPutSlot(modifier, str(slot).encode(), value)
-            if ret != PutSlotError.PSE_NO_ERROR:
+            ret = lib.IMPutSlot(modifier, slot.encode(), value)
+            if ret != lib.PSE_NO_ERROR:
                 raise PUT_SLOT_ERROR[ret](slot)
 
-        if lib.IMModify(modifier) is ffi.NULL:
+        instance = lib.IMModify(modifier)
+        environment_changed(self._env)
+        if instance == ffi.NULL:
             raise CLIPSError(self._env, code=lib.IMError(self._env))
 
     def send(self, message: str, arguments: str = None) -> type:
@@ -145,12 +161,14 @@ class Instance:
 
         args = arguments.encode() if arguments is not None else ffi.NULL
         lib.Send(self._env, instance, message.encode(), args, output)
+        environment_changed(self._env)
 
         return clips.values.python_value(self._env, output)
 
     def delete(self):
         """Directly delete the instance."""
         ret = lib.DeleteInstance(self._ist)
+        environment_changed(self._env)
         if ret != lib.UIE_NO_ERROR:
             raise CLIPSError(self._env, code=ret)
 
@@ -160,6 +178,7 @@ class Instance:
 
         """
         ret = lib.UnmakeInstance(self._ist)
+        environment_changed(self._env)
         if ret != lib.UIE_NO_ERROR:
             raise CLIPSError(self._env, code=ret)
 
@@ -174,36 +193,73 @@ class Class:
 
     """
 
-    __slots__ = '_env', '_name'
+    __slots__ = '_env', '_name', '_name_str', '_cls', '_epoch', '_pp'
 
     def __init__(self, env: ffi.CData, name: str):
         self._env = env
         self._name = name.encode()
+        self._name_str = None
+        self._cls = ffi.NULL
+        self._epoch = None
+        self._pp = None
+
+    @classmethod
+    def _from_ptr(cls, env: ffi.CData, name: bytes,
+                  defclass: ffi.CData) -> 'Class':
+        """Build the Class from its encoded name priming its pointer cache."""
+        obj = cls.__new__(cls)
+        obj._env = env
+        obj._name = name
+        obj._name_str = None
+        obj._cls = defclass
+        obj._epoch = environment_data(env, 'epoch')
+        obj._pp = None
+
+        return obj
 
     def __hash__(self):
         return hash(self._ptr())
 
     def __eq__(self, cls):
+        if self is cls:
+            return True
+        if not isinstance(cls, Class):
+            return NotImplemented
+
         return self._ptr() == cls._ptr()
 
     def __str__(self):
-        string = lib.DefclassPPForm(self._ptr())
-        string = ffi.string(string).decode() if string != ffi.NULL else ''
-
-        return ' '.join(string.split())
+        return self._pp_string()
 
     def __repr__(self):
-        string = lib.DefclassPPForm(self._ptr())
-        string = ffi.string(string).decode() if string != ffi.NULL else ''
-
-        return "%s: %s" % (self.__class__.__name__, ' '.join(string.split()))
+        return "%s: %s" % (self.__class__.__name__, self._pp_string())
 
     def _ptr(self) -> ffi.CData:
-        cls = lib.FindDefclass(self._env, self._name)
-        if cls == ffi.NULL:
-            raise CLIPSError(self._env, 'Class <%s> not defined' % self.name)
+        epoch = environment_data(self._env, 'epoch')
+
+        if self._epoch != epoch:
+            cls = lib.FindDefclass(self._env, self._name)
+            if cls == ffi.NULL:
+                raise CLIPSError(
+                    self._env, 'Class <%s> not defined' % self._name.decode())
+
+            self._cls = cls
+            self._epoch = epoch
+            self._pp = None
+
+        return self._cls
+
+    def _pp_string(self) -> str:
+        """The Class PP form, cached as long as the Class pointer is."""
+        defclass = self._ptr()
+
+        if self._pp is None:
+            string = lib.DefclassPPForm(defclass)
+            string = ffi.string(string).decode() if string != ffi.NULL else ''
 
-        return cls
+            self._pp = ' '.join(string.split())
+
+        return self._pp
 
     @property
     def abstract(self) -> bool:
@@ -218,7 +274,10 @@ class Class:
     @property
     def name(self) -> str:
         """Class name."""
-        return ffi.string(lib.DefclassName(self._ptr())).decode()
+        if self._name_str is None:
+            self._name_str = ffi.string(lib.DefclassName(self._ptr())).decode()
+
+        return self._name_str
 
     @property
     def module(self) -> Module:
@@ -267,20 +326,24 @@ class Class:
         if ret != lib.IBE_NO_ERROR:
             raise CLIPSError(self._env, code=ret)
 
+        value = environment_data(self._env, 'value')
+
         for slot, slot_val in slots.items():
-            value = clips.values.clips_value(self._env, value=slot_val)
+            clips.values.clips_value(
+                self._env, value=slot_val, clips_val=value)
 
-            ret = lib.IBPutSlot(builder, str(slot).encode(), value)
-            if ret != PutSlotError.PSE_NO_ERROR:
+            ret = lib.IBPutSlot(builder, slot.encode(), value)
+            if ret != lib.PSE_NO_ERROR:
                 raise PUT_SLOT_ERROR[ret](slot)
 
         instance = lib.IBMake(
             builder, instance_name.encode()
             if instance_name is not None else ffi.NULL)
+        environment_changed(self._env)
         if instance != ffi.NULL:
             return Instance(self._env, instance)
         else:
-            raise CLIPSError(self._env, code=lib.FBError(self._env))
+            raise CLIPSError(self._env, code=lib.IBError(self._env))
 
     def subclass(self, defclass: 'Class') -> bool:
         """True if the Class is a subclass of the given one."""
@@ -292,21 +355,21 @@ class Class:
 
     def slots(self, inherited: bool = False) -> iter:
         """Iterate over the Slots of the class."""
-        value = clips.values.clips_value(self._env)
+        defclass = self._ptr()
 
-        lib.ClassSlots(self._ptr(), value, inherited)
-
-        return (ClassSlot(self._env, self.name, n)
-                for n in clips.values.python_value(self._env, value))
+        return iter([ClassSlot._from_ptr(self._env, self._name, defclass, n)
+                     for n, _ in class_slots(self._env, defclass, inherited)])
 
     def instances(self) -> iter:
         """Iterate over the instances of the class."""
-        ist = lib.GetNextInstanceInClass(self._ptr(), ffi.NULL)
+        defclass = self._ptr()
+
+        size = lib.CollectInstancesInClass(defclass, ffi.NULL, 0)
+        instances = ffi.new('Instance *[]', size)
 
-        while ist != ffi.NULL:
-            yield Instance(self._env, ist)
+        lib.CollectInstancesInClass(defclass, instances, size)
 
-            ist = lib.GetNextInstanceInClass(self._ptr(), ist)
+        return iter([Instance._from_retained(self._env, i) for i in instances])
 
     def subclasses(self, inherited: bool = False) -> iter:
         """Iterate over the subclasses of the class.
@@ -314,13 +377,11 @@ class Class:
         Equivalent to the CLIPS (class-subclasses) function.
 
         """
-        value = clips.values.clips_value(self._env)
+        value = environment_data(self._env, 'value')
 
         lib.ClassSubclasses(self._ptr(), value, inherited)
 
-        for defclass in classes(
-                self._env, clips.values.python_value(self._env, value)):
-            yield defclass
+        return iter(classes(self._env, value))
 
     def superclasses(self, inherited=False) -> iter:
         """Iterate over the superclasses of the class.
@@ -328,32 +389,36 @@ class Class:
         Equivalent to the CLIPS class-superclasses command.
 
         """
-        value = clips.values.clips_value(self._env)
+        value = environment_data(self._env, 'value')
 
-        lib.ClassSuperclasses(self._ptr(), value, int(inherited))
+        lib.ClassSuperclasses(self._ptr(), value, inherited)
 
-        for defclass in classes(
-                self._env, clips.values.python_value(self._env, value)):
-            yield defclass
+        return iter(classes(self._env, value))
 
     def message_handlers(self) -> iter:
         """Iterate over the message handlers of the class."""
-        index = lib.GetNextDefmessageHandler(self._ptr(), 0)
+        defclass = self._ptr()
+
+        size = lib.CollectDefmessageHandlers(defclass, ffi.NULL, 0)
+        indexes = ffi.new('unsigned []', size)
 
-        while index != 0:
-            yield MessageHandler(self._env, self.name, index)
+        lib.CollectDefmessageHandlers(defclass, indexes, size)
 
-            index = lib.GetNextDefmessageHandler(self._ptr(), index)
+        return iter([
+            MessageHandler._from_ptr(self._env, self._name, defclass, i)
+            for i in indexes])
 
     def find_message_handler(
             self, name: str, handler_type: str = 'primary') -> 'MessageHandler':
         """Returns the MessageHandler given its name and type."""
+        defclass = self._ptr()
+
         ident = lib.FindDefmessageHandler(
-            self._ptr(), name.encode(), handler_type.encode())
+            defclass, name.encode(), handler_type.encode())
         if ident == 0:
             raise CLIPSError(self._env)
 
-        return MessageHandler(self._env, self.name, ident)
+        return MessageHandler._from_ptr(self._env, self._name, defclass, ident)
 
     def undefine(self):
         """Undefine the Class.
@@ -363,7 +428,9 @@ class Class:
         The object becomes unusable after this method has been called.
 
         """
-        if not lib.Undefclass(self._ptr(), self._env):
+        ret = lib.Undefclass(self._ptr(), self._env)
+        environment_changed(self._env)
+        if not ret:
             raise CLIPSError(self._env)
 
 
@@ -374,18 +441,43 @@ class ClassSlot:
 
     """
 
-    __slots__ = '_env', '_cls', '_name'
+    __slots__ = '_env', '_cls', '_name', '_name_str', '_defclass', '_epoch'
 
     def __init__(self, env: ffi.CData, cls: str, name: str):
         self._env = env
         self._cls = cls.encode()
         self._name = name.encode()
+        self._name_str = name
+        self._defclass = ffi.NULL
+        self._epoch = None
+
+    @classmethod
+    def _from_ptr(cls, env: ffi.CData, cls_name: bytes,
+                  defclass: ffi.CData, name: str) -> 'ClassSlot':
+        """Build the ClassSlot from its Class encoded name
+        priming its pointer cache.
+
+        """
+        obj = cls.__new__(cls)
+        obj._env = env
+        obj._cls = cls_name
+        obj._name = name.encode()
+        obj._name_str = name
+        obj._defclass = defclass
+        obj._epoch = environment_data(env, 'epoch')
+
+        return obj
 
     def __hash__(self):
-        return hash(self._ptr()) + hash(self._name)
+        return hash((self._ptr(), self._name))
 
     def __eq__(self, cls):
-        return self._ptr() == cls._ptr() and self._name == cls._name
+        if self is cls:
+            return True
+        if not isinstance(cls, ClassSlot):
+            return NotImplemented
+
+        return self._name == cls._name and self._ptr() == cls._ptr()
 
     def __str__(self):
         return self.name
@@ -394,17 +486,23 @@ class ClassSlot:
         return "%s: %s" % (self.__class__.__name__, self.name)
 
     def _ptr(self) -> ffi.CData:
-        cls = lib.FindDefclass(self._env, self._cls)
-        if cls == ffi.NULL:
-            raise CLIPSError(
-                self._env, 'Class <%s> not defined' % self._cls.decode())
+        epoch = environment_data(self._env, 'epoch')
 
-        return cls
+        if self._epoch != epoch:
+            cls = lib.FindDefclass(self._env, self._cls)
+            if cls == ffi.NULL:
+                raise CLIPSError(
+                    self._env, 'Class <%s> not defined' % self._cls.decode())
+
+            self._defclass = cls
+            self._epoch = epoch
+
+        return self._defclass
 
     @property
     def name(self):
         """The Slot name."""
-        return self._name.decode()
+        return self._name_str
 
     @property
     def public(self) -> bool:
@@ -433,7 +531,7 @@ class ClassSlot:
         Equivalent to the CLIPS (slot-types) function.
 
         """
-        value = clips.values.clips_value(self._env)
+        value = environment_data(self._env, 'value')
 
         if lib.SlotTypes(self._ptr(), self._name, value):
             return clips.values.python_value(self._env, value)
@@ -447,7 +545,7 @@ class ClassSlot:
         Equivalent to the CLIPS (slot-sources) function.
 
         """
-        value = clips.values.clips_value(self._env)
+        value = environment_data(self._env, 'value')
 
         if lib.SlotSources(self._ptr(), self._name, value):
             return clips.values.python_value(self._env, value)
@@ -461,7 +559,7 @@ class ClassSlot:
         Equivalent to the CLIPS (slot-range) function.
 
         """
-        value = clips.values.clips_value(self._env)
+        value = environment_data(self._env, 'value')
 
         if lib.SlotRange(self._ptr(), self._name, value):
             return clips.values.python_value(self._env, value)
@@ -475,7 +573,7 @@ class ClassSlot:
         Equivalent to the CLIPS (slot-facets) function.
 
         """
-        value = clips.values.clips_value(self._env)
+        value = environment_data(self._env, 'value')
 
         if lib.SlotFacets(self._ptr(), self._name, value):
             return clips.values.python_value(self._env, value)
@@ -489,7 +587,7 @@ class ClassSlot:
         Equivalent to the CLIPS slot-cardinality function.
 
         """
-        value = clips.values.clips_value(self._env)
+        value = environment_data(self._env, 'value')
 
         if lib.SlotCardinality(self._ptr(), self._name, value):
             return clips.values.python_value(self._env, value)
@@ -503,7 +601,7 @@ class ClassSlot:
         Equivalent to the CLIPS (slot-default-value) function.
 
         """
-        value = clips.values.clips_value(self._env)
+        value = environment_data(self._env, 'value')
 
         if lib.SlotDefaultValue(self._ptr(), self._name, value):
             return clips.values.python_value(self._env, value)
@@ -517,7 +615,7 @@ class ClassSlot:
         Equivalent to the CLIPS (slot-allowed-values) function.
 
         """
-        value = clips.values.clips_value(self._env)
+        value = environment_data(self._env, 'value')
 
         if lib.SlotAllowedValues(self._ptr(), self._name, value):
             return clips.values.python_value(self._env, value)
@@ -530,13 +628,11 @@ class ClassSlot:
         Equivalent to the CLIPS (slot-allowed-classes) function.
 
         """
-        value = clips.values.clips_value(self._env)
+        value = environment_data(self._env, 'value')
 
         lib.SlotAllowedClasses(self._ptr(), self._name, value)
 
-        if isinstance(value, tuple):
-            for defclass in classes(self._env, value):
-                yield defclass
+        return iter(classes(self._env, value))
 
 
 class MessageHandler:
@@ -544,38 +640,76 @@ class MessageHandler:
 
     """
 
-    __slots__ = '_env', '_cls', '_idx'
+    __slots__ = '_env', '_cls', '_idx', '_defclass', '_epoch', '_pp'
 
     def __init__(self, env: ffi.CData, cls: str, idx: int):
         self._env = env
         self._cls = cls.encode()
         self._idx = idx
+        self._defclass = ffi.NULL
+        self._epoch = None
+        self._pp = None
+
+    @classmethod
+    def _from_ptr(cls, env: ffi.CData, cls_name: bytes,
+                  defclass: ffi.CData, idx: int) -> 'MessageHandler':
+        """Build the MessageHandler from its Class encoded name
+        priming its pointer cache.
+
+        """
+        obj = cls.__new__(cls)
+        obj._env = env
+        obj._cls = cls_name
+        obj._idx = idx
+        obj._defclass = defclass
+        obj._epoch = environment_data(env, 'epoch')
+        obj._pp = None
+
+        return obj
 
     def __hash__(self):
-        return hash(self._ptr()) + self._idx
+        return hash((self._ptr(), self._idx))
 
-    def __eq__(self, cls):
-        return self._ptr() == cls._ptr() and self._idx == cls._idx
+    def __eq__(self, handler):
+        if self is handler:
+            return True
+        if not isinstance(handler, MessageHandler):
+            return NotImplemented
 
-    def __str__(self):
-        string = lib.DefmessageHandlerPPForm(self._ptr(), self._idx)
-        string = ffi.string(string).decode() if string != ffi.NULL else ''
+        return self._idx == handler._idx and self._ptr() == handler._ptr()
 
-        return ' '.join(string.split())
+    def __str__(self):
+        return self._pp_string()
 
     def __repr__(self):
-        string = lib.DefmessageHandlerPPForm(self._ptr(), self._idx)
-        string = ffi.string(string).decode() if string != ffi.NULL else ''
-
-        return "%s: %s" % (self.__class__.__name__, ' '.join(string.split()))
+        return "%s: %s" % (self.__class__.__name__, self._pp_string())
 
     def _ptr(self) -> ffi.CData:
-        cls = lib.FindDefclass(self._env, self._cls)
-        if cls == ffi.NULL:
-            raise CLIPSError(
-                self._env, 'Class <%s> not defined' % self._cls.decode())
+        epoch = environment_data(self._env, 'epoch')
+
+        if self._epoch != epoch:
+            cls = lib.FindDefclass(self._env, self._cls)
+            if cls == ffi.NULL:
+                raise CLIPSError(
+                    self._env, 'Class <%s> not defined' % self._cls.decode())
+
+            self._defclass = cls
+            self._epoch = epoch
+            self._pp = None
+
+        return self._defclass
 
-        return cls
+    def _pp_string(self) -> str:
+        """The MessageHandler PP form, cached as long as its Class pointer."""
+        defclass = self._ptr()
+
+        if self._pp is None:
+            string = lib.DefmessageHandlerPPForm(defclass, self._idx)
+            string = ffi.string(string).decode() if string != ffi.NULL else ''
+
+            self._pp = ' '.join(string.split())
+
+        return self._pp
 
     @property
     def name(self) -> str:
@@ -612,7 +746,9 @@ class MessageHandler:
         The object becomes unusable after this method has been called.
 
         """
-        if not lib.UndefmessageHandler(self._ptr(), self._idx, self._env):
+        ret = lib.UndefmessageHandler(self._ptr(), self._idx, self._env)
+        environment_changed(self._env)
+        if not ret:
             raise CLIPSError(self._env)
 
 
@@ -627,42 +763,87 @@ class DefinedInstances:
 
     """
 
-    __slots__ = '_env', '_name'
+    __slots__ = '_env', '_name', '_name_str', '_dfs', '_epoch', '_pp'
 
     def __init__(self, env: ffi.CData, name: str):
         self._env = env
         self._name = name.encode()
+        self._name_str = name
+        self._dfs = ffi.NULL
+        self._epoch = None
+        self._pp = None
+
+    @classmethod
+    def _from_ptr(cls, env: ffi.CData, name: bytes,
+                  dfs: ffi.CData) -> 'DefinedInstances':
+        """Build the DefinedInstances from its encoded name
+        priming its pointer cache.
+
+        """
+        obj = cls.__new__(cls)
+        obj._env = env
+        obj._name = name
+        obj._name_str = None
+        obj._dfs = dfs
+        obj._epoch = environment_data(env, 'epoch')
+        obj._pp = None
+
+        return obj
 
     def __hash__(self):
         return hash(self._ptr())
 
     def __eq__(self, dis):
+        if self is dis:
+            return True
+        if not isinstance(dis, DefinedInstances):
+            return NotImplemented
+
         return self._ptr() == dis._ptr()
 
     def __str__(self):
-        string = lib.DefinstancesPPForm(self._ptr())
-        string = ffi.string(string).decode() if string != ffi.NULL else ''
-
-        return ' '.join(string.split())
+        return self._pp_string()
 
     def __repr__(self):
-        string = lib.DefinstancesPPForm(self._ptr())
-        string = ffi.string(string).decode() if string != ffi.NULL else ''
-
-        return "%s: %s" % (self.__class__.__name__, ' '.join(string.split()))
+        return "%s: %s" % (self.__class__.__name__, self._pp_string())
 
     def _ptr(self) -> ffi.CData:
-        dfc = lib.FindDefinstances(self._env, self._name)
-        if dfc == ffi.NULL:
-            raise CLIPSError(
-                self._env, 'DefinedInstances <%s> not defined' % self.name)
+        epoch = environment_data(self._env, 'epoch')
+
+        if self._epoch != epoch:
+            dfs = lib.FindDefinstances(self._env, self._name)
+            if dfs == ffi.NULL:
+                raise CLIPSError(
+                    self._env, 'DefinedInstances <%s> not defined' % self.name)
+
+            self._dfs = dfs
+            self._epoch = epoch
+            self._pp = None
 
-        return dfc
+        return self._dfs
+
+    def _pp_string(self) -> str:
+        """The DefinedInstances PP form,
+        cached as long as the DefinedInstances pointer is.
+
+        """
+        dfs = self._ptr()
+
+        if self._pp is None:
+            string = lib.DefinstancesPPForm(dfs)
+            string = ffi.string(string).decode() if string != ffi.NULL else ''
+
+            self._pp = ' '.join(string.split())
+
+        return self._pp
 
     @property
     def name(self) -> str:
         """The DefinedInstances name."""
-        return self._name.decode()
+        if self._name_str is None:
+            self._name_str = self._name.decode()
+
+        return self._name_str
 
     @property
     def module(self) -> Module:
@@ -688,7 +869,9 @@ class DefinedInstances:
         The object becomes unusable after this method has been called.
 
         """
-        if not lib.Undefinstances(self._ptr(), self._env):
+        ret = lib.Undefinstances(self._ptr(), self._env)
+        environment_changed(self._env)
+        if not ret:
             raise CLIPSError(self._env)
 
 
@@ -701,10 +884,26 @@ class Classes:
 
     """
 
-    __slots__ = ['_env']
+    __slots__ = '_env', '_lookups', '_lookups_epoch'
 
     def __init__(self, env: ffi.CData):
         self._env = env
+        self._lookups = {}
+        self._lookups_epoch = None
+
+    def _lookup(self, key: tuple) -> (Class, DefinedInstances):
+        """Return the object found by a previous lookup with the same key.
+
+        Lookups are forgotten as soon as the Environment changes.
+
+        """
+        epoch = environment_data(self._env, 'epoch')
+
+        if self._lookups_epoch != epoch:
+            self._lookups.clear()
+            self._lookups_epoch = epoch
+
+        return self._lookups.get(key)
 
     @property
     def default_mode(self) -> ClassDefaultMode:
@@ -734,53 +933,74 @@ class Classes:
 
     def classes(self) -> iter:
         """Iterate over the defined Classes."""
-        defclass = lib.GetNextDefclass(self._env, ffi.NULL)
+        size = lib.CollectDefclasses(self._env, ffi.NULL, ffi.NULL, 0)
+        defclasses = ffi.new('Defclass *[]', size)
+        names = ffi.new('const char *[]', size)
 
-        while defclass != ffi.NULL:
-            name = ffi.string(lib.DefclassName(defclass)).decode()
-            yield Class(self._env, name)
+        lib.CollectDefclasses(self._env, defclasses, names, size)
 
-            defclass = lib.GetNextDefclass(self._env, defclass)
+        return iter([Class._from_ptr(self._env, ffi.string(n), c)
+                     for c, n in zip(defclasses, names)])
 
     def find_class(self, name: str) -> Class:
         """Find the Class by the given name."""
-        defclass = lib.FindDefclass(self._env, name.encode())
+        found = self._lookup(('class', name))
+        if found is not None:
+            return found
+
+        encoded = name.encode()
+
+        defclass = lib.FindDefclass(self._env, encoded)
         if defclass == ffi.NULL:
             raise LookupError("Class '%s' not found" % name)
 
-        return Class(self._env, name)
+        found = self._lookups[('class', name)] = Class._from_ptr(
+            self._env, encoded, defclass)
+
+        return found
 
     def defined_instances(self) -> iter:
         """Iterate over the DefinedInstances."""
-        definstances = lib.GetNextDefinstances(self._env, ffi.NULL)
+        definstances_name = lib.DefinstancesName
+        next_definstances = lib.GetNextDefinstances
+
+        definstances = next_definstances(self._env, ffi.NULL)
         while definstances != ffi.NULL:
-            name = ffi.string(lib.DefinstancesName(definstances)).decode()
-            yield DefinedInstances(self._env, name)
+            name = ffi.string(definstances_name(definstances))
+            yield DefinedInstances._from_ptr(self._env, name, definstances)
 
-            definstances = lib.GetNextDefinstances(self._env, definstances)
+            definstances = next_definstances(self._env, definstances)
 
     def find_defined_instances(self, name: str) -> DefinedInstances:
         """Find the DefinedInstances by its name."""
-        dfs = lib.FindDefinstances(self._env, name.encode())
+        found = self._lookup(('definstances', name))
+        if found is not None:
+            return found
+
+        encoded = name.encode()
+
+        dfs = lib.FindDefinstances(self._env, encoded)
         if dfs == ffi.NULL:
             raise LookupError("DefinedInstances '%s' not found" % name)
 
-        return DefinedInstances(self._env, name)
+        found = self._lookups[('definstances', name)] = \
+            DefinedInstances._from_ptr(self._env, encoded, dfs)
+
+        return found
 
     def instances(self) -> iter:
         """Iterate over the defined Instancees."""
-        definstance = lib.GetNextInstance(self._env, ffi.NULL)
+        size = lib.CollectInstances(self._env, ffi.NULL, 0)
+        instances = ffi.new('Instance *[]', size)
 
-        while definstance != ffi.NULL:
-            yield Instance(self._env, definstance)
+        lib.CollectInstances(self._env, instances, size)
 
-            definstance = lib.GetNextInstance(self._env, definstance)
+        return iter([Instance._from_retained(self._env, i) for i in instances])
 
     def find_instance(self, name: str, module: Module = None) -> Instance:
         """Find the Instance by the given name."""
         module = module._mdl if module is not None else ffi.NULL
-        definstance = lib.FindInstance(self._env, module, name.encode(),
-                                       ClassDefaultMode.CONSERVATION_MODE)
+        definstance = lib.FindInstance(self._env, module, name.encode(), True)
         if definstance == ffi.NULL:
             raise LookupError("Instance '%s' not found" % name)
 
@@ -796,16 +1016,17 @@ class Classes:
         """
         instances = instances.encode()
 
-        if os.path.exists(instances):
-            try:
+        if instances_file(instances):
+            if binary_instances_file(instances):
                 return self._load_instances_binary(instances)
-            except CLIPSError:
+            else:
                 return self._load_instances_text(instances)
         else:
             return self._load_instances_string(instances)
 
     def _load_instances_binary(self, instances: str) -> int:
         ret = lib.BinaryLoadInstances(self._env, instances)
+        environment_changed(self._env)
         if ret == -1:
             raise CLIPSError(self._env)
 
@@ -813,6 +1034,7 @@ class Classes:
 
     def _load_instances_text(self, instances: str) -> int:
         ret = lib.LoadInstances(self._env, instances)
+        environment_changed(self._env)
         if ret == -1:
             raise CLIPSError(self._env)
 
@@ -820,6 +1042,7 @@ class Classes:
 
     def _load_instances_string(self, instances: str) -> int:
         ret = lib.LoadInstancesFromString(self._env, instances, len(instances))
+        environment_changed(self._env)
         if ret == -1:
             raise CLIPSError(self._env)
 
@@ -835,15 +1058,15 @@ class Classes:
         """
         instances = instances.encode()
 
-        if os.path.exists(instances):
+        if instances_file(instances):
             ret = lib.RestoreInstances(self._env, instances)
-            if ret == -1:
-                raise CLIPSError(self._env)
         else:
             ret = lib.RestoreInstancesFromString(
                 self._env, instances, len(instances))
-            if ret == -1:
-                raise CLIPSError(self._env)
+
+        environment_changed(self._env)
+        if ret == -1:
+            raise CLIPSError(self._env)
 
         return ret
 
@@ -866,23 +1089,87 @@ class Classes:
         return ret
 
 
-def slot_value(env: ffi.CData, ist: ffi.CData, slot: str) -> type:
-    value = clips.values.clips_value(env)
+def class_slots(env: ffi.CData, defclass: ffi.CData, inherited: bool) -> tuple:
+    """Return the Defclass slot names both as strings and encoded.
+
+    The names are cached until the Environment changes.
 
-    ret = lib.DirectGetSlot(ist, slot.encode(), value)
+    """
+    data = ENVIRONMENT_DATA[env]
+
+    if data.class_slots_epoch != data.epoch:
+        data.class_slots = {}
+        data.class_slots_epoch = data.epoch
+
+    key = defclass, inherited
+    names = data.class_slots.get(key)
+
+    if names is None:
+        lib.ClassSlots(defclass, data.value, inherited)
+        names = tuple((n, n.encode())
+                      for n in clips.values.python_value(env, data.value))
+        data.class_slots[key] = names
+
+    return names
+
+
+def slot_value(env: ffi.CData, ist: ffi.CData, slot: bytes) -> type:
+    value = environment_data(env, 'value')
+
+    ret = lib.DirectGetSlot(ist, slot, value)
     if ret != lib.GSE_NO_ERROR:
         raise CLIPSError(env, code=ret)
 
     return clips.values.python_value(env, value)
 
 
-def classes(env: ffi.CData, names: (list, tuple)) -> iter:
-    for name in names:
-        defclass = lib.FindDefclass(env, name.encode())
+def classes(env: ffi.CData, value: ffi.CData) -> list:
+    """Resolve the Classes named within the given CLIPS value."""
+    size = lib.LookupDefclasses(env, value, ffi.NULL, ffi.NULL, 0)
+    defclasses = ffi.new('Defclass *[]', size)
+    names = ffi.new('const char *[]', size)
+
+    lib.LookupDefclasses(env, value, defclasses, names, size)
+
+    resolved = []
+    undefined = []
+    for defclass, name in zip(defclasses, names):
         if defclass == ffi.NULL:
-            raise CLIPSError(env)
+            undefined.append(ffi.string(name).decode())
+        else:
+            resolved.append(Class._from_ptr(env, ffi.string(name), defclass))
+
+    if undefined:
+        raise CLIPSError(
+            env, 'Classes <%s> not defined' % ', '.join(undefined))
+
+    return resolved
+
+
+def instances_file(instances: bytes) -> bool:
+    """True if the given instances refer to a file.
+
+    Instances given as a string start with a parenthesis,
+    they can be told apart without querying the file system.
+
+    """
+    if instances.lstrip().startswith(b'('):
+        return False
+
+    return os.path.exists(instances)
+
+
+def binary_instances_file(path: bytes) -> bool:
+    """True if the file was saved in CLIPS binary format.
+
+    Binary instance files start with a non printable prefix identifier
+    while text ones begin with printable characters or whitespace.
+
+    """
+    with open(path, 'rb') as instances_file:
+        header = instances_file.read(1)
 
-        yield Class(env, name)
+    return header != b'' and header < b' ' and not header.isspace()
 
 
 def instance_pp_string(env: ffi.CData, ist: ffi.CData) -> str:
@@ -890,4 +1177,4 @@ def instance_pp_string(env: ffi.CData, ist: ffi.CData) -> str:
     lib.SBReset(builder)
     lib.InstancePPForm(ist, builder)
 
-    return ffi.string(builder.contents).decode()
+    return ffi.unpack(builder.contents, builder.length).decode()
@@ -41,6 +41,230 @@ bool ImpliedDeftemplate(Deftemplate *template)
     return template->implied;
 }
 
+/* Store up to size Facts within the given array.
+ * The stored Facts are retained and must be released by the caller.
+ * Return the amount of Facts within the Environment. */
+size_t CollectFacts(Environment *env, Fact **facts, size_t size)
+{
+    size_t count = 0;
+    Fact *fact = GetNextFact(env, NULL);
+
+    while (fact != NULL) {
+        if (count < size) {
+            RetainFact(fact);
+            facts[count] = fact;
+        }
+
+        count++;
+        fact = GetNextFact(env, fact);
+    }
+
+    return count;
+}
+
+/* Store up to size Facts of the given Deftemplate within the array.
+ * The stored Facts are retained and must be released by the caller.
+ * Return the amount of Facts of the Deftemplate. */
+size_t CollectFactsInTemplate(Deftemplate *template,
+                              Fact **facts,
+                              size_t size)
+{
+    size_t count = 0;
+    Fact *fact = GetNextFactInTemplate(template, NULL);
+
+    while (fact != NULL) {
+        if (count < size) {
+            RetainFact(fact);
+            facts[count] = fact;
+        }
+
+        count++;
+        fact = GetNextFactInTemplate(template, fact);
+    }
+
+    return count;
+}
+
+/* Store up to size Defrules and their names within the given arrays.
+ * Return the amount of Defrules within the current Module. */
+size_t CollectDefrules(Environment *env,
+                       Defrule **rules,
+                       const char **names,
+                       size_t size)
+{
+    size_t count = 0;
+    Defrule *rule = GetNextDefrule(env, NULL);
+
+    while (rule != NULL) {
+        if (count < size) {
+            rules[count] = rule;
+            names[count] = DefruleName(rule);
+        }
+
+        count++;
+        rule = GetNextDefrule(env, rule);
+    }
+
+    return count;
+}
+
+/* Store up to size Activations within the given array.
+ * Return the amount of Activations within the Agenda. */
+size_t CollectActivations(Environment *env,
+                          Activation **activations,
+                          size_t size)
+{
+    size_t count = 0;
+    Activation *activation = GetNextActivation(env, NULL);
+
+    while (activation != NULL) {
+        if (count < size)
+            activations[count] = activation;
+
+        count++;
+        activation = GetNextActivation(env, activation);
+    }
+
+    return count;
+}
+
+/* Store up to size Defclasses and their names within the given arrays.
+ * Return the amount of Defclasses within the current Module. */
+size_t CollectDefclasses(Environment *env,
+                         Defclass **classes,
+                         const char **names,
+                         size_t size)
+{
+    size_t count = 0;
+    Defclass *defclass = GetNextDefclass(env, NULL);
+
+    while (defclass != NULL) {
+        if (count < size) {
+            classes[count] = defclass;
+            names[count] = DefclassName(defclass);
+        }
+
+        count++;
+        defclass = GetNextDefclass(env, defclass);
+    }
+
+    return count;
+}
+
+/* Store up to size Defclasses named within the given multifield value
+ * and their names within the given arrays.
+ * Unknown Defclasses are stored as NULL.
+ * Return the amount of names within the value. */
+size_t LookupDefclasses(Environment *env,
+                        CLIPSValue *value,
+                        Defclass **classes,
+                        const char **names,
+                        size_t size)
+{
+    size_t index;
+    CLIPSLexeme *name;
+
+    if (value->header->type != MULTIFIELD_TYPE)
+        return 0;
+
+    for (index = 0;
+         index < value->multifieldValue->length && index < size;
+         index++) {
+        name = value->multifieldValue->contents[index].lexemeValue;
+        classes[index] = FindDefclass(env, name->contents);
+        names[index] = name->contents;
+    }
+
+    return value->multifieldValue->length;
+}
+
+/* Store up to size Defmessage-handler indexes within the given array.
+ * Return the amount of Defmessage-handlers within the Defclass. */
+size_t CollectDefmessageHandlers(Defclass *defclass,
+                                 unsigned *indexes,
+                                 size_t size)
+{
+    size_t count = 0;
+    unsigned index = GetNextDefmessageHandler(defclass, 0);
+
+    while (index != 0) {
+        if (count < size)
+            indexes[count] = index;
+
+        count++;
+        index = GetNextDefmessageHandler(defclass, index);
+    }
+
+    return count;
+}
+
+/* Store up to size Instances within the given array.
+ * The stored Instances are retained and must be released by the caller.
+ * Return the amount of Instances within the Environment. */
+size_t CollectInstances(Environment *env, Instance **instances, size_t size)
+{
+    size_t count = 0;
+    Instance *instance = GetNextInstance(env, NULL);
+
+    while (instance != NULL) {
+        if (count < size) {
+            RetainInstance(instance);
+            instances[count] = instance;
+        }
+
+        count++;
+        instance = GetNextInstance(env, instance);
+    }
+
+    return count;
+}
+
+/* Store up to size Instances of the given Defclass within the array.
+ * The stored Instances are retained and must be released by the caller.
+ * Return the amount of Instances of the Defclass. */
+size_t CollectInstancesInClass(Defclass *defclass,
+                               Instance **instances,
+                               size_t size)
+{
+    size_t count = 0;
+    Instance *instance = GetNextInstanceInClass(defclass, NULL);
+
+    while (instance != NULL) {
+        if (count < size) {
+            RetainInstance(instance);
+            instances[count] = instance;
+        }
+
+        count++;
+        instance = GetNextInstanceInClass(defclass, instance);
+    }
+
+    return count;
+}
+
+/* Store up to size UDF arguments not yet read within the given array.
+ * Return false if any argument is not of the expected types
+ * or if they do not fit within the array. */
+bool UDFRemainingArguments(UDFContext *udfc,
+                           unsigned expected,
+                           CLIPSValue *values,
+                           size_t size)
+{
+    size_t index = 0;
+    UDFValue value;
+
+    while (UDFHasNextArgument(udfc)) {
+        if (index == size)
+            return false;
+        if (!UDFNextArgument(udfc, expected, &value))
+            return false;
+
+        values[index++].value = value.value;
+    }
+
+    return true;
+}
+
 /* User Defined Functions support. */
 static void python_function(Environment *env, UDFContext *udfc, UDFValue *out);
 
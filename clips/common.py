@@ -28,7 +28,6 @@
 # EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 from enum import IntEnum
-from collections import namedtuple
 
 from clips._clips import lib, ffi
 
@@ -38,9 +37,9 @@ class CLIPSError(RuntimeError):
 
     def __init__(self, env: ffi.CData, message: str = None, code: int = None):
         if message is None:
-            routers = environment_data(env, 'routers')
+            routers = ENVIRONMENT_DATA[env].routers
             message = routers['python-error-router'].last_message
-            message = message.lstrip('\n').rstrip('\n').replace('\n', ' ')
+            message = message.strip('\n').replace('\n', ' ')
 
         super(CLIPSError, self).__init__(message)
 
@@ -156,28 +155,31 @@ def initialize_environment_data(env: ffi.CData) -> 'EnvData':
 
     functions = UserFunctions({}, {})
 
-    ENVIRONMENT_DATA[env] = EnvData(builders, modifiers, {}, functions)
+    data = EnvData(builders, modifiers, {}, functions)
+    data.release_fact = environment_finalizer(env, data, lib.ReleaseFact)
+    data.release_instance = environment_finalizer(
+        env, data, lib.ReleaseInstance)
+    ENVIRONMENT_DATA[env] = data
 
     lib.DefinePythonFunction(env)
 
-    return ENVIRONMENT_DATA[env]
+    return data
 
 
 def delete_environment_data(env: ffi.CData):
     data = ENVIRONMENT_DATA.pop(env, None)
 
     if data is not None:
-        fact, instance, function, string, multifield = data.builders
+        builders = data.builders
+        lib.FBDispose(builders.fact)
+        lib.IBDispose(builders.instance)
+        lib.FCBDispose(builders.function)
+        lib.SBDispose(builders.string)
+        lib.MBDispose(builders.multifield)
 
-        lib.FBDispose(fact)
-        lib.IBDispose(instance)
-        lib.FCBDispose(function)
-        lib.SBDispose(string)
-        lib.MBDispose(multifield)
-
-        fact, instance = data.modifiers
-        lib.FMDispose(fact)
-        lib.IMDispose(instance)
+        modifiers = data.modifiers
+        lib.FMDispose(modifiers.fact)
+        lib.IMDispose(modifiers.instance)
 
 
 def environment_data(env: ffi.CData, name: str) -> type:
@@ -195,17 +197,99 @@ def environment_modifier(env: ffi.CData, name: str) -> ffi.CData:
     return getattr(ENVIRONMENT_DATA[env].modifiers, name)
 
 
+def environment_finalizer(env: ffi.CData, data: 'EnvData',
+                          release: callable) -> callable:
+    """Return a destructor for pointers retained within the Environment.
+
+    The pointer is released only if the Environment was not deleted
+    in the meantime, as deleting it frees all its data.
+
+    """
+    def finalizer(pointer: ffi.CData):
+        try:
+            if ENVIRONMENT_DATA.get(env) is data:
+                release(pointer)
+        except (AttributeError, TypeError):
+            pass  # mostly happening during interpreter shutdown
+
+    return finalizer
+
+
+def environment_changed(env: ffi.CData):
+    """Signal that CLIPS code was executed within the Environment.
+
+    CLIPS does not notify when a construct is undefined or redefined.
+    Increasing the Environment epoch invalidates the cached construct pointers.
+
+    """
+    ENVIRONMENT_DATA[env].epoch += 1
+
+
+class EnvData:
+    """Environment specific data."""
+
+    __slots__ = ('builders', 'modifiers', 'routers', 'user_functions',
+                 'value', 'udf_value', 'epoch', 'activations',
+                 'activations_module', 'agenda_changed',
+                 'class_slots', 'class_slots_epoch',
+                 'template_slots', 'template_slots_epoch',
+                 'release_fact', 'release_instance')
+
+    def __init__(self, builders: 'EnvBuilders', modifiers: 'EnvModifiers',
+                 routers: dict, user_functions: 'UserFunctions'):
+        self.builders = builders
+        self.modifiers = modifiers
+        self.routers = routers
+        self.user_functions = user_functions
+        # scratch value for CLIPS functions which do not execute code
+        self.value = ffi.new('CLIPSValue *')
+        # scratch value for decoding the python-function arguments
+        self.udf_value = ffi.new('UDFValue *')
+        self.epoch = 0
+        self.activations = None
+        self.activations_module = None
+        self.agenda_changed = False
+        self.class_slots = {}
+        self.class_slots_epoch = None
+        self.template_slots = {}
+        self.template_slots_epoch = None
+        self.release_fact = None
+        self.release_instance = None
+
+
+class EnvBuilders:
+    """Environment specific builders."""
+
+    __slots__ = 'fact', 'instance', 'function', 'string', 'multifield'
+
+    def __init__(self, fact: ffi.CData, instance: ffi.CData,
+                 function: ffi.CData, string: ffi.CData,
+                 multifield: ffi.CData):
+        self.fact = fact
+        self.instance = instance
+        self.function = function
+        self.string = string
+        self.multifield = multifield
+
+
+class EnvModifiers:
+    """Environment specific modifiers."""
+
+    __slots__ = 'fact', 'instance'
+
+    def __init__(self, fact: ffi.CData, instance: ffi.CData):
+        self.fact = fact
+        self.instance = instance
+
+
+class UserFunctions:
+    """Environment specific Python functions and external addresses."""
+
+    __slots__ = 'functions', 'external_addresses'
+
+    def __init__(self, functions: dict, external_addresses: dict):
+        self.functions = functions
+        self.external_addresses = external_addresses
+
+
 ENVIRONMENT_DATA = {}
-EnvData = namedtuple('EnvData', ('builders',
-                                 'modifiers',
-                                 'routers',
-                                 'user_functions'))
-EnvBuilders = namedtuple('EnvBuilders', ('fact',
-                                         'instance',
-                                         'function',
-                                         'string',
-                                         'multifield'))
-EnvModifiers = namedtuple('EnvModifiers', ('fact',
-                                           'instance'))
-UserFunctions = namedtuple('UserFunctions', ('functions',
-                                             'external_addresses'))
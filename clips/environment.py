@@ -27,6 +27,8 @@
 # OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
 # EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
+from operator import attrgetter
+
 import clips
 
 from clips.facts import Facts
@@ -35,7 +37,7 @@ from clips.classes import Classes
 from clips.modules import Modules
 from clips.functions import Functions
 from clips.routers import Routers, ErrorRouter
-from clips.common import CLIPSError
+from clips.common import CLIPSError, environment_changed
 from clips.common import initialize_environment_data, delete_environment_data
 
 from clips._clips import lib
@@ -48,7 +50,7 @@ class Environment:
     """
 
     __slots__ = ('_env', '_facts', '_agenda', '_classes',
-                 '_modules', '_functions', '_routers', '_namespaces')
+                 '_modules', '_functions', '_routers')
 
     def __init__(self):
         self._env = lib.CreateEnvironment()
@@ -64,15 +66,6 @@ class Environment:
 
         self._routers.add_router(ErrorRouter())
 
-        # mapping between the namespace and the methods it exposes
-        self._namespaces = {m: n for n in (self._facts,
-                                           self._agenda,
-                                           self._classes,
-                                           self._modules,
-                                           self._functions,
-                                           self._routers)
-                            for m in dir(n) if not m.startswith('_')}
-
     def __del__(self):
         try:
             delete_environment_data(self._env)
@@ -80,27 +73,6 @@ class Environment:
         except (AttributeError, KeyError, TypeError):
             pass  # mostly happening during interpreter shutdown
 
-    def __getattr__(self, attr):
-        try:
-            return getattr(self._namespaces[attr], attr)
-        except (KeyError, AttributeError):
-            raise AttributeError("'%s' object has no attribute '%s'" %
-                                 (self.__class__.__name__, attr))
-
-    def __setattr__(self, attr, value):
-        if attr in self.__slots__:
-            super(Environment, self).__setattr__(attr, value)
-            return
-
-        try:
-            setattr(self._namespaces[attr], attr, value)
-        except (KeyError, AttributeError):
-            raise AttributeError("'%s' object has no attribute '%s'" %
-                                 (self.__class__.__name__, attr))
-
-    def __dir__(self):
-        return dir(self.__class__) + list(self._namespaces.keys())
-
     def load(self, path: str, binary: bool = False):
         """Load a set of constructs into the CLIPS data base.
 
@@ -111,10 +83,13 @@ class Environment:
 
         """
         if binary:
-            if not lib.Bload(self._env, path.encode()):
+            ret = lib.Bload(self._env, path.encode())
+            environment_changed(self._env)
+            if not ret:
                 raise CLIPSError(self._env)
         else:
             ret = lib.Load(self._env, path.encode())
+            environment_changed(self._env)
             if ret != lib.LE_NO_ERROR:
                 raise CLIPSError(self._env, code=ret)
 
@@ -139,7 +114,9 @@ class Environment:
         Equivalent to the CLIPS (batch*) function.
 
         """
-        if lib.BatchStar(self._env, path.encode()) != 1:
+        ret = lib.BatchStar(self._env, path.encode())
+        environment_changed(self._env)
+        if ret != 1:
             raise CLIPSError(self._env)
 
     def build(self, construct: str):
@@ -149,6 +126,7 @@ class Environment:
 
         """
         ret = lib.Build(self._env, construct.encode())
+        environment_changed(self._env)
         if ret != lib.BE_NO_ERROR:
             raise CLIPSError(self._env, code=ret)
 
@@ -161,6 +139,7 @@ class Environment:
         value = clips.values.clips_value(self._env)
 
         ret = lib.Eval(self._env, expression.encode(), value)
+        environment_changed(self._env)
         if ret != lib.EE_NO_ERROR:
             raise CLIPSError(self._env, code=ret)
 
@@ -172,7 +151,9 @@ class Environment:
         Equivalent to the CLIPS (reset) function.
 
         """
-        if lib.Reset(self._env):
+        ret = lib.Reset(self._env)
+        environment_changed(self._env)
+        if ret:
             raise CLIPSError(self._env)
 
     def clear(self):
@@ -181,5 +162,32 @@ class Environment:
         Equivalent to the CLIPS (clear) function.
 
         """
-        if not lib.Clear(self._env):
+        ret = lib.Clear(self._env)
+        environment_changed(self._env)
+        if not ret:
             raise CLIPSError(self._env)
+
+
+def namespace_property(namespace: str, cls: type, name: str) -> property:
+    """Expose the namespace attribute as an Environment property."""
+    def setter(self, value):
+        setattr(getattr(self, namespace), name, value)
+
+    return property(attrgetter('.'.join((namespace, name))), setter,
+                    doc=getattr(cls, name).__doc__)
+
+
+# the namespaces and the attribute holding them within the Environment
+NAMESPACES = (('_facts', Facts),
+              ('_agenda', Agenda),
+              ('_classes', Classes),
+              ('_modules', Modules),
+              ('_functions', Functions),
+              ('_routers', Routers))
+
+
+for attribute, namespace_class in NAMESPACES:
+    for method in dir(namespace_class):
+        if not method.startswith('_') and not hasattr(Environment, method):
+            setattr(Environment, method,
+                    namespace_property(attribute, namespace_class, method))
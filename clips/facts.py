@@ -45,8 +45,10 @@ from itertools import chain
 import clips
 
 from clips.modules import Module
-from clips.common import PutSlotError, PUT_SLOT_ERROR
+from clips.common import PUT_SLOT_ERROR
 from clips.common import environment_builder, environment_modifier
+from clips.common import environment_data, environment_changed
+from clips.common import ENVIRONMENT_DATA
 from clips.common import CLIPSError, SaveMode, TemplateSlotDefaultType
 
 from clips._clips import lib, ffi
@@ -59,19 +61,27 @@ class Fact:
 
     def __init__(self, env: ffi.CData, fact: ffi.CData):
         self._env = env
-        self._fact = fact
-        lib.RetainFact(self._fact)
+        lib.RetainFact(fact)
+        self._fact = ffi.gc(fact, environment_data(env, 'release_fact'))
 
-    def __del__(self):
-        try:
-            lib.ReleaseFact(self._env, self._fact)
-        except (AttributeError, TypeError):
-            pass  # mostly happening during interpreter shutdown
+    @classmethod
+    def _from_retained(cls, env: ffi.CData, fact: ffi.CData) -> 'Fact':
+        """Wrap a Fact pointer which was already retained in C."""
+        obj = cls.__new__(cls)
+        obj._env = env
+        obj._fact = ffi.gc(fact, environment_data(env, 'release_fact'))
+
+        return obj
 
     def __hash__(self):
         return hash(self._fact)
 
     def __eq__(self, fact):
+        if self is fact:
+            return True
+        if not isinstance(fact, Fact):
+            return NotImplemented
+
         return self._fact == fact._fact
 
     def __str__(self):
@@ -100,8 +110,9 @@ class Fact:
     def template(self) -> 'Template':
         """The associated Template."""
         template = lib.FactDeftemplate(self._fact)
-        name = ffi.string(lib.DeftemplateName(template)).decode()
-        return Template(self._env, name)
+        name = ffi.string(lib.DeftemplateName(template))
+
+        return Template._from_ptr(self._env, name, template)
 
     def retract(self):
         """Retract the fact from the CLIPS environment."""
@@ -119,14 +130,23 @@ class ImpliedFact(Fact):
 
     """
 
+    __slots__ = ()
+
     def __iter__(self):
         return chain(slot_value(self._env, self._fact))
 
     def __len__(self):
-        return len(slot_value(self._env, self._fact))
+        return implied_slot(self._env, self._fact).length
 
     def __getitem__(self, index):
-        return slot_value(self._env, self._fact)[index]
+        if isinstance(index, slice):
+            return slot_value(self._env, self._fact)[index]
+
+        multifield = implied_slot(self._env, self._fact)
+        index = range(multifield.length)[index]
+
+        return clips.values.python_value(
+            self._env, multifield.contents + index)
 
 
 class TemplateFact(Fact):
@@ -138,7 +158,7 @@ class TemplateFact(Fact):
 
     """
 
-    __slots__ = '_env', '_fact'
+    __slots__ = ()
 
     def __init__(self, env: ffi.CData, fact: ffi.CData):
         super().__init__(env, fact)
@@ -147,13 +167,11 @@ class TemplateFact(Fact):
         return chain(slot_values(self._env, self._fact))
 
     def __len__(self):
-        slots = slot_values(self._env, self._fact)
-
-        return len(tuple(slots))
+        return len(template_slots(self._env, lib.FactDeftemplate(self._fact)))
 
     def __getitem__(self, key):
         try:
-            return slot_value(self._env, self._fact, slot=str(key))
+            return slot_value(self._env, self._fact, str(key).encode())
         except CLIPSError as error:
             if error.code == lib.GSE_SLOT_NOT_FOUND_ERROR:
                 raise KeyError("'%s'" % key)
@@ -173,15 +191,20 @@ class TemplateFact(Fact):
         if ret != lib.FME_NO_ERROR:
             raise CLIPSError(self._env, code=ret)
 
+        value = environment_data(self._env, 'value')
+
         for slot, slot_val in slots.items():
-            value = clips.values.clips_value(self._env, value=slot_val)
+            clips.values.clips_value(
+                self._env, value=slot_val, clips_val=value)
 
-            ret = lib.FMPutSlot(modifier, str(slot).encode(), value)
-            if ret != PutSlotError.PSE_NO_ERROR:
+            ret = lib.FMPutSlot(modifier, slot.encode(), value)
+            if ret != lib.PSE_NO_ERROR:
                 raise PUT_SLOT_ERROR[ret](slot)
 
-        if lib.FMModify(modifier) is ffi.NULL:
-            raise CLIPSError(self._env, code=lib.FBError(self._env))
+        fact = lib.FMModify(modifier)
+        environment_changed(self._env)
+        if fact == ffi.NULL:
+            raise CLIPSError(self._env, code=lib.FMError(self._env))
 
 
 class Template:
@@ -196,36 +219,73 @@ class Template:
 
     """
 
-    __slots__ = '_env', '_name'
+    __slots__ = '_env', '_name', '_name_str', '_tpl', '_epoch', '_pp'
 
     def __init__(self, env: ffi.CData, name: str):
         self._env = env
         self._name = name.encode()
+        self._name_str = name
+        self._tpl = ffi.NULL
+        self._epoch = None
+        self._pp = None
+
+    @classmethod
+    def _from_ptr(cls, env: ffi.CData, name: bytes,
+                  template: ffi.CData) -> 'Template':
+        """Build the Template from its encoded name priming its cache."""
+        obj = cls.__new__(cls)
+        obj._env = env
+        obj._name = name
+        obj._name_str = None
+        obj._tpl = template
+        obj._epoch = environment_data(env, 'epoch')
+        obj._pp = None
+
+        return obj
 
     def __hash__(self):
         return hash(self._ptr())
 
     def __eq__(self, tpl):
+        if self is tpl:
+            return True
+        if not isinstance(tpl, Template):
+            return NotImplemented
+
         return self._ptr() == tpl._ptr()
 
     def __str__(self):
-        string = lib.DeftemplatePPForm(self._ptr())
-        string = ffi.string(string).decode() if string != ffi.NULL else ''
-
-        return ' '.join(string.split())
+        return self._pp_string()
 
     def __repr__(self):
-        string = lib.DeftemplatePPForm(self._ptr())
-        string = ffi.string(string).decode() if string != ffi.NULL else ''
-
-        return "%s: %s" % (self.__class__.__name__, ' '.join(string.split()))
+        return "%s: %s" % (self.__class__.__name__, self._pp_string())
 
     def _ptr(self) -> ffi.CData:
-        tpl = lib.FindDeftemplate(self._env, self._name)
-        if tpl == ffi.NULL:
-            raise CLIPSError(self._env, 'Template <%s> not defined' % self.name)
+        epoch = environment_data(self._env, 'epoch')
 
-        return tpl
+        if self._epoch != epoch:
+            tpl = lib.FindDeftemplate(self._env, self._name)
+            if tpl == ffi.NULL:
+                raise CLIPSError(
+                    self._env, 'Template <%s> not defined' % self.name)
+
+            self._tpl = tpl
+            self._epoch = epoch
+            self._pp = None
+
+        return self._tpl
+
+    def _pp_string(self) -> str:
+        """The Template PP form, cached as long as its pointer is."""
+        template = self._ptr()
+
+        if self._pp is None:
+            string = lib.DeftemplatePPForm(template)
+            string = ffi.string(string).decode() if string != ffi.NULL else ''
+
+            self._pp = ' '.join(string.split())
+
+        return self._pp
 
     @property
     def implied(self) -> bool:
@@ -235,7 +295,10 @@ class Template:
     @property
     def name(self) -> str:
         """Template name."""
-        return self._name.decode()
+        if self._name_str is None:
+            self._name_str = self._name.decode()
+
+        return self._name_str
 
     @property
     def module(self) -> Module:
@@ -256,15 +319,13 @@ class Template:
     @property
     def slots(self) -> tuple:
         """The slots of the template."""
-        if self.implied:
-            return ()
-
-        value = clips.values.clips_value(self._env)
+        template = self._ptr()
 
-        lib.DeftemplateSlotNames(self._ptr(), value)
+        if lib.ImpliedDeftemplate(template):
+            return ()
 
         return tuple(TemplateSlot(self._env, self.name, n)
-                     for n in clips.values.python_value(self._env, value))
+                     for n, _ in template_slots(self._env, template))
 
     @property
     def watch(self) -> bool:
@@ -278,11 +339,14 @@ class Template:
 
     def facts(self) -> iter:
         """Iterate over the asserted Facts belonging to this Template."""
-        fact = lib.GetNextFactInTemplate(self._ptr(), ffi.NULL)
-        while fact != ffi.NULL:
-            yield new_fact(self._ptr(), fact)
+        template = self._ptr()
+
+        size = lib.CollectFactsInTemplate(template, ffi.NULL, 0)
+        facts = ffi.new('Fact *[]', size)
 
-            fact = lib.GetNextFactInTemplate(self._ptr(), fact)
+        lib.CollectFactsInTemplate(template, facts, size)
+
+        return iter([new_fact(self._env, f, retained=True) for f in facts])
 
     def assert_fact(self, **slots) -> TemplateFact:
         """Assert a new fact with the given slot values.
@@ -298,14 +362,18 @@ class Template:
         if ret != lib.FBE_NO_ERROR:
             raise CLIPSError(self._env, code=ret)
 
+        value = environment_data(self._env, 'value')
+
         for slot, slot_val in slots.items():
-            value = clips.values.clips_value(self._env, value=slot_val)
+            clips.values.clips_value(
+                self._env, value=slot_val, clips_val=value)
 
-            ret = lib.FBPutSlot(builder, str(slot).encode(), value)
-            if ret != PutSlotError.PSE_NO_ERROR:
+            ret = lib.FBPutSlot(builder, slot.encode(), value)
+            if ret != lib.PSE_NO_ERROR:
                 raise PUT_SLOT_ERROR[ret](slot)
 
         fact = lib.FBAssert(builder)
+        environment_changed(self._env)
         if fact != ffi.NULL:
             return TemplateFact(self._env, fact)
         else:
@@ -319,7 +387,9 @@ class Template:
         The object becomes unusable after this method has been called.
 
         """
-        if not lib.Undeftemplate(self._ptr(), self._env):
+        ret = lib.Undeftemplate(self._ptr(), self._env)
+        environment_changed(self._env)
+        if not ret:
             raise CLIPSError(self._env)
 
 
@@ -338,10 +408,15 @@ class TemplateSlot:
         self._name = name.encode()
 
     def __hash__(self):
-        return hash(self._ptr()) + hash(self._name)
+        return hash((self._ptr(), self._name))
 
     def __eq__(self, slot):
-        return self._ptr() == slot._ptr() and self._name == slot._name
+        if self is slot:
+            return True
+        if not isinstance(slot, TemplateSlot):
+            return NotImplemented
+
+        return self._name == slot._name and self._ptr() == slot._ptr()
 
     def __str__(self):
         return self.name
@@ -365,7 +440,7 @@ class TemplateSlot:
     @property
     def multifield(self) -> bool:
         """True if the slot is a multifield slot."""
-        return bool(lib.DeftemplateSlotMultiP(self._ptr(), self._name))
+        return lib.DeftemplateSlotMultiP(self._ptr(), self._name)
 
     @property
     def types(self) -> tuple:
@@ -374,7 +449,7 @@ class TemplateSlot:
         Equivalent to the CLIPS (deftemplate-slot-types) function.
 
         """
-        value = clips.values.clips_value(self._env)
+        value = environment_data(self._env, 'value')
 
         if lib.DeftemplateSlotTypes(self._ptr(), self._name, value):
             return clips.values.python_value(self._env, value)
@@ -388,7 +463,7 @@ class TemplateSlot:
         Equivalent to the CLIPS (deftemplate-slot-range) function.
 
         """
-        value = clips.values.clips_value(self._env)
+        value = environment_data(self._env, 'value')
 
         if lib.DeftemplateSlotRange(self._ptr(), self._name, value):
             return clips.values.python_value(self._env, value)
@@ -402,7 +477,7 @@ class TemplateSlot:
         Equivalent to the CLIPS (deftemplate-slot-cardinality) function.
 
         """
-        value = clips.values.clips_value(self._env)
+        value = environment_data(self._env, 'value')
 
         if lib.DeftemplateSlotCardinality(self._ptr(), self._name, value):
             return clips.values.python_value(self._env, value)
@@ -426,7 +501,7 @@ class TemplateSlot:
         Equivalent to the CLIPS (deftemplate-slot-default-value) function.
 
         """
-        value = clips.values.clips_value(self._env)
+        value = environment_data(self._env, 'value')
 
         if lib.DeftemplateSlotDefaultValue(self._ptr(), self._name, value):
             return clips.values.python_value(self._env, value)
@@ -440,7 +515,7 @@ class TemplateSlot:
         Equivalent to the CLIPS (slot-allowed-values) function.
 
         """
-        value = clips.values.clips_value(self._env)
+        value = environment_data(self._env, 'value')
 
         if lib.DeftemplateSlotAllowedValues(self._ptr(), self._name, value):
             return clips.values.python_value(self._env, value)
@@ -469,6 +544,11 @@ class DefinedFacts:
         return hash(self._ptr())
 
     def __eq__(self, dfc):
+        if self is dfc:
+            return True
+        if not isinstance(dfc, DefinedFacts):
+            return NotImplemented
+
         return self._ptr() == dfc._ptr()
 
     def __str__(self):
@@ -520,7 +600,9 @@ class DefinedFacts:
         The object becomes unusable after this method has been called.
 
         """
-        if not lib.Undeffacts(self._ptr(), self._env):
+        ret = lib.Undeffacts(self._ptr(), self._env)
+        environment_changed(self._env)
+        if not ret:
             raise CLIPSError(self._env)
 
 
@@ -533,7 +615,7 @@ class Facts:
 
     """
 
-    __slots__ = ['_env']
+    __slots__ = '_env',
 
     def __init__(self, env):
         self._env = env
@@ -549,28 +631,31 @@ class Facts:
 
     def facts(self) -> iter:
         """Iterate over the asserted Facts."""
-        fact = lib.GetNextFact(self._env, ffi.NULL)
-        while fact != ffi.NULL:
-            yield new_fact(self._env, fact)
+        size = lib.CollectFacts(self._env, ffi.NULL, 0)
+        facts = ffi.new('Fact *[]', size)
 
-            fact = lib.GetNextFact(self._env, fact)
+        lib.CollectFacts(self._env, facts, size)
+
+        return iter([new_fact(self._env, f, retained=True) for f in facts])
 
     def templates(self) -> iter:
         """Iterate over the defined Templates."""
         template = lib.GetNextDeftemplate(self._env, ffi.NULL)
         while template != ffi.NULL:
-            name = ffi.string(lib.DeftemplateName(template)).decode()
-            yield Template(self._env, name)
+            name = ffi.string(lib.DeftemplateName(template))
+            yield Template._from_ptr(self._env, name, template)
 
             template = lib.GetNextDeftemplate(self._env, template)
 
     def find_template(self, name: str) -> Template:
         """Find the Template by its name."""
-        tpl = lib.FindDeftemplate(self._env, name.encode())
+        encoded = name.encode()
+
+        tpl = lib.FindDeftemplate(self._env, encoded)
         if tpl == ffi.NULL:
             raise LookupError("Template '%s' not found" % name)
 
-        return Template(self._env, name)
+        return Template._from_ptr(self._env, encoded, tpl)
 
     def defined_facts(self) -> iter:
         """Iterate over the DefinedFacts."""
@@ -592,6 +677,7 @@ class Facts:
     def assert_string(self, string: str) -> (ImpliedFact, TemplateFact):
         """Assert a fact as string."""
         fact = lib.AssertString(self._env, string.encode())
+        environment_changed(self._env)
 
         if fact == ffi.NULL:
             raise CLIPSError(
@@ -610,11 +696,13 @@ class Facts:
         facts = facts.encode()
 
         if os.path.exists(facts):
-            if not lib.LoadFacts(self._env, facts):
-                raise CLIPSError(self._env)
+            ret = lib.LoadFacts(self._env, facts)
         else:
-            if not lib.LoadFactsFromString(self._env, facts, len(facts)):
-                raise CLIPSError(self._env)
+            ret = lib.LoadFactsFromString(self._env, facts, len(facts))
+
+        environment_changed(self._env)
+        if not ret:
+            raise CLIPSError(self._env)
 
     def save_facts(self, path, mode=SaveMode.LOCAL_SAVE):
         """Save the facts in the system to the specified file.
@@ -626,20 +714,47 @@ class Facts:
             raise CLIPSError(self._env)
 
 
-def new_fact(env: ffi.CData, fact: ffi.CData) -> (ImpliedFact, TemplateFact):
+def new_fact(env: ffi.CData, fact: ffi.CData,
+             retained: bool = False) -> (ImpliedFact, TemplateFact):
     if lib.ImpliedDeftemplate(lib.FactDeftemplate(fact)):
-        return ImpliedFact(env, fact)
+        cls = ImpliedFact
     else:
-        return TemplateFact(env, fact)
+        cls = TemplateFact
+
+    return cls._from_retained(env, fact) if retained else cls(env, fact)
+
+
+def template_slots(env: ffi.CData, template: ffi.CData) -> tuple:
+    """Return the Deftemplate slot names both as strings and encoded.
 
+    The names are cached until the Environment changes.
 
-def slot_value(env: ffi.CData, fact: ffi.CData, slot: str = None) -> type:
-    value = clips.values.clips_value(env)
-    slot = slot.encode() if slot is not None else ffi.NULL
-    implied = lib.ImpliedDeftemplate(lib.FactDeftemplate(fact))
+    """
+    data = ENVIRONMENT_DATA[env]
+
+    if data.template_slots_epoch != data.epoch:
+        data.template_slots = {}
+        data.template_slots_epoch = data.epoch
+
+    names = data.template_slots.get(template)
+
+    if names is None:
+        lib.DeftemplateSlotNames(template, data.value)
+        names = tuple((n, n.encode())
+                      for n in clips.values.python_value(env, data.value))
+        data.template_slots[template] = names
 
-    if not implied and slot == ffi.NULL:
-        raise ValueError()
+    return names
+
+
+def slot_value(env: ffi.CData, fact: ffi.CData,
+               slot: bytes = ffi.NULL) -> type:
+    """Return the Fact slot value.
+
+    Implied Facts hold a single unnamed slot, hence no slot is given.
+
+    """
+    value = environment_data(env, 'value')
 
     ret = lib.GetFactSlot(fact, slot, value)
     if ret != lib.GSE_NO_ERROR:
@@ -648,12 +763,21 @@ def slot_value(env: ffi.CData, fact: ffi.CData, slot: str = None) -> type:
     return clips.values.python_value(env, value)
 
 
+def implied_slot(env: ffi.CData, fact: ffi.CData) -> ffi.CData:
+    """Return the multifield holding the Implied Fact values."""
+    value = environment_data(env, 'value')
+
+    ret = lib.GetFactSlot(fact, ffi.NULL, value)
+    if ret != lib.GSE_NO_ERROR:
+        raise CLIPSError(env, code=ret)
+
+    return value.multifieldValue
+
+
 def slot_values(env: ffi.CData, fact: ffi.CData) -> iter:
-    value = clips.values.clips_value(env)
-    lib.FactSlotNames(fact, value)
+    names = template_slots(env, lib.FactDeftemplate(fact))
 
-    return ((s, slot_value(env, fact, slot=s))
-            for s in clips.values.python_value(env, value))
+    return ((n, slot_value(env, fact, s)) for n, s in names)
 
 
 def fact_pp_string(env: ffi.CData, fact: ffi.CData) -> str:
@@ -661,4 +785,4 @@ def fact_pp_string(env: ffi.CData, fact: ffi.CData) -> str:
     lib.SBReset(builder)
     lib.FactPPForm(fact, builder, False)
 
-    return ffi.string(builder.contents).decode()
+    return ffi.unpack(builder.contents, builder.length).decode()
@@ -43,6 +43,7 @@ import clips
 
 from clips.modules import Module
 from clips.common import CLIPSError, environment_builder, environment_data
+from clips.common import environment_changed, ENVIRONMENT_DATA
 
 from clips._clips import lib, ffi
 
@@ -64,6 +65,11 @@ class Function:
         return hash(self._ptr())
 
     def __eq__(self, fnc):
+        if self is fnc:
+            return True
+        if not isinstance(fnc, Function):
+            return NotImplemented
+
         return self._ptr() == fnc._ptr()
 
     def __str__(self):
@@ -89,6 +95,7 @@ class Function:
                 builder, clips.values.clips_value(self._env, value=argument))
 
         ret = lib.FCBCall(builder, lib.DeffunctionName(self._ptr()), value)
+        environment_changed(self._env)
         if ret != lib.FCBE_NO_ERROR:
             raise CLIPSError(self._env, code=ret)
 
@@ -141,7 +148,9 @@ class Function:
         The object becomes unusable after this method has been called.
 
         """
-        if not lib.Undeffunction(self._ptr(), self._env):
+        ret = lib.Undeffunction(self._ptr(), self._env)
+        environment_changed(self._env)
+        if not ret:
             raise CLIPSError(self._env)
 
 
@@ -162,6 +171,11 @@ class Generic:
         return hash(self._ptr())
 
     def __eq__(self, gnc):
+        if self is gnc:
+            return True
+        if not isinstance(gnc, Generic):
+            return NotImplemented
+
         return self._ptr() == gnc._ptr()
 
     def __str__(self):
@@ -187,6 +201,7 @@ class Generic:
                 builder, clips.values.clips_value(self._env, value=argument))
 
         ret = lib.FCBCall(builder, lib.DefgenericName(self._ptr()), value)
+        environment_changed(self._env)
         if ret != lib.FCBE_NO_ERROR:
             raise CLIPSError(self._env, code=ret)
 
@@ -248,7 +263,9 @@ class Generic:
         The object becomes unusable after this method has been called.
 
         """
-        if not lib.Undefgeneric(self._ptr(), self._env):
+        ret = lib.Undefgeneric(self._ptr(), self._env)
+        environment_changed(self._env)
+        if not ret:
             raise CLIPSError(self._env)
 
 
@@ -266,10 +283,15 @@ class Method(object):
         self._idx = idx
 
     def __hash__(self):
-        return hash(self._ptr()) + self._idx
+        return hash((self._ptr(), self._idx))
 
     def __eq__(self, gnc):
-        return self._ptr() == gnc._ptr() and self._idx == gnc._idx
+        if self is gnc:
+            return True
+        if not isinstance(gnc, Method):
+            return NotImplemented
+
+        return self._idx == gnc._idx and self._ptr() == gnc._ptr()
 
     def __str__(self):
         string = lib.DefmethodPPForm(self._ptr(), self._idx)
@@ -320,7 +342,7 @@ class Method(object):
         lib.SBReset(builder)
         lib.DefmethodDescription(self._ptr(), self._idx, builder)
 
-        return ffi.string(builder.contents).decode()
+        return ffi.unpack(builder.contents, builder.length).decode()
 
     def undefine(self):
         """Undefine the Method.
@@ -330,7 +352,9 @@ class Method(object):
         The object becomes unusable after this method has been called.
 
         """
-        if not lib.Undefmethod(self._ptr(), self._idx, self._env):
+        ret = lib.Undefmethod(self._ptr(), self._idx, self._env)
+        environment_changed(self._env)
+        if not ret:
             raise CLIPSError(self._env)
 
 
@@ -343,7 +367,7 @@ class Functions:
 
     """
 
-    __slots__ = ['_env']
+    __slots__ = '_env',
 
     def __init__(self, env: ffi.CData):
         self._env = env
@@ -384,6 +408,7 @@ class Functions:
                 builder, clips.values.clips_value(self._env, value=argument))
 
         ret = lib.FCBCall(builder, function.encode(), value)
+        environment_changed(self._env)
         if ret != lib.FCBE_NO_ERROR:
             raise CLIPSError(self._env, code=ret)
 
@@ -441,14 +466,19 @@ class Functions:
         user_functions.functions[name] = function
 
         ret = lib.Build(self._env, DEFFUNCTION.format(name).encode())
+        environment_changed(self._env)
         if ret != lib.BE_NO_ERROR:
             raise CLIPSError(self._env, code=ret)
 
 
 @ffi.def_extern()
 def python_function(env: ffi.CData, context: ffi.CData, output: ffi.CData):
-    arguments = []
-    value = clips.values.clips_udf_value(env)
+    # CLIPS code run before the call may have undefined constructs
+    environment_changed(env)
+
+    data = ENVIRONMENT_DATA[env]
+    epoch = data.epoch
+    value = data.udf_value
 
     if lib.UDFFirstArgument(context, lib.SYMBOL_BIT, value):
         funcname = clips.values.python_value(env, value)
@@ -456,16 +486,17 @@ def python_function(env: ffi.CData, context: ffi.CData, output: ffi.CData):
         lib.UDFThrowError(context)
         return
 
-    while lib.UDFHasNextArgument(context):
-        if lib.UDFNextArgument(context, clips.values.ANY_TYPE_BITS, value):
-            arguments.append(clips.values.python_value(env, value))
-        else:
-            lib.UDFThrowError(context)
-            return
+    # the function name was read, the count is at least one
+    values = ffi.new('CLIPSValue[]', lib.UDFArgumentCount(context) - 1)
+    if lib.UDFRemainingArguments(
+            context, clips.values.ANY_TYPE_BITS, values, len(values)):
+        arguments = [clips.values.python_value(env, v) for v in values]
+    else:
+        lib.UDFThrowError(context)
+        return
 
     try:
-        user_functions = environment_data(env, 'user_functions')
-        ret = user_functions.functions[funcname](*arguments)
+        ret = data.user_functions.functions[funcname](*arguments)
     except Exception as error:
         message = "[PYCODEFUN1] %r" % error
         string = "\n".join((message, traceback.format_exc()))
@@ -477,6 +508,11 @@ def python_function(env: ffi.CData, context: ffi.CData, output: ffi.CData):
     else:
         clips.values.clips_udf_value(env, ret, output)
 
+    # the function used the Environment: pointers it cached may be
+    # invalidated by the CLIPS code running after it returns
+    if data.epoch != epoch:
+        environment_changed(env)
+
 
 DEFFUNCTION = """
 (deffunction {0} ($?args)
@@ -37,7 +37,7 @@
 
 import clips
 
-from clips.common import CLIPSError
+from clips.common import CLIPSError, environment_changed
 
 from clips._clips import lib, ffi
 
@@ -55,6 +55,11 @@ class Module:
         return hash(self._ptr())
 
     def __eq__(self, mdl):
+        if self is mdl:
+            return True
+        if not isinstance(mdl, Module):
+            return NotImplemented
+
         return self._ptr() == mdl._ptr()
 
     def __str__(self):
@@ -99,6 +104,11 @@ class Global:
         return hash(self._ptr())
 
     def __eq__(self, glb):
+        if self is glb:
+            return True
+        if not isinstance(glb, Global):
+            return NotImplemented
+
         return self._ptr() == glb._ptr()
 
     def __str__(self):
@@ -176,7 +186,9 @@ class Global:
         The object becomes unusable after this method has been called.
 
         """
-        if not lib.Undefglobal(self._ptr(), self._env):
+        ret = lib.Undefglobal(self._ptr(), self._env)
+        environment_changed(self._env)
+        if not ret:
             raise CLIPSError(self._env)
 
 
@@ -189,7 +201,7 @@ class Modules:
 
     """
 
-    __slots__ = ['_env']
+    __slots__ = '_env',
 
     def __init__(self, env: ffi.CData):
         self._env = env
@@ -214,6 +226,7 @@ class Modules:
 
         """
         lib.SetCurrentModule(self._env, module._ptr())
+        environment_changed(self._env)
 
     @property
     def reset_globals(self) -> bool:
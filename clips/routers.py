@@ -122,7 +122,7 @@ class Router:
 class ErrorRouter(Router):
     """Router capturing error messages for CLIPSError exceptions."""
 
-    __slots__ = '_env', '_name', '_userdata', '_priority', '_last_message'
+    __slots__ = '_last_message',
 
     def __init__(self):
         super().__init__('python-error-router', 40)
@@ -154,7 +154,7 @@ class LoggingRouter(Router):
 
     """
 
-    __slots__ = '_env', '_name', '_userdata', '_priority', '_message'
+    __slots__ = '_message',
 
     LOGGERS = {'stdout': logging.info,
                'stderr': logging.error,
@@ -197,7 +197,7 @@ class Routers:
 
     """
 
-    __slots__ = ['_env']
+    __slots__ = '_env',
 
     def __init__(self, env):
         self._env = env
@@ -243,6 +243,7 @@ class Routers:
 
 @ffi.def_extern()
 def query_function(env: ffi.CData, name: ffi.CData, context: ffi.CData):
+    common.environment_changed(env)
     router = ffi.from_handle(context)
 
     return bool(router.query(ffi.string(name).decode()))
@@ -251,6 +252,7 @@ def query_function(env: ffi.CData, name: ffi.CData, context: ffi.CData):
 @ffi.def_extern()
 def write_function(env: ffi.CData, name: ffi.CData,
                    message: ffi.CData, context: ffi.CData):
+    common.environment_changed(env)
     router = ffi.from_handle(context)
 
     try:
@@ -264,6 +266,7 @@ def write_function(env: ffi.CData, name: ffi.CData,
 
 @ffi.def_extern()
 def read_function(env: ffi.CData, name: ffi.CData, context: ffi.CData):
+    common.environment_changed(env)
     router = ffi.from_handle(context)
 
     try:
@@ -280,6 +283,7 @@ def read_function(env: ffi.CData, name: ffi.CData, context: ffi.CData):
 @ffi.def_extern()
 def unread_function(env: ffi.CData, char: ffi.CData,
                     name: ffi.CData, context: ffi.CData):
+    common.environment_changed(env)
     router = ffi.from_handle(context)
 
     try:
@@ -295,6 +299,7 @@ def unread_function(env: ffi.CData, char: ffi.CData,
 
 @ffi.def_extern()
 def exit_function(env: ffi.CData, exitcode: int, context: ffi.CData):
+    common.environment_changed(env)
     router = ffi.from_handle(context)
 
     try:
@@ -51,13 +51,24 @@ def python_value(env, value: ffi.CData) -> type:
     return PYTHON_VALUES[value.header.type](env, value)
 
 
-def clips_value(env: ffi.CData, value: type = ffi.NULL) -> ffi.CData:
+def python_multifield(env: ffi.CData, value: ffi.CData) -> tuple:
+    """Convert a CLIPS multifield into a Python tuple."""
+    multifield = value.multifieldValue
+    contents = multifield.contents
+    elements = (contents + i for i in range(multifield.length))
+
+    return tuple([PYTHON_VALUES[e.header.type](env, e) for e in elements])
+
+
+def clips_value(env: ffi.CData, value: type = ffi.NULL,
+                clips_val: ffi.CData = ffi.NULL) -> ffi.CData:
     """Convert a Python value into CLIPS.
 
     If no value is provided, an empty value is returned.
+    If a CLIPSValue is provided, it is filled in place of a new one.
 
     """
-    val = ffi.new("CLIPSValue *")
+    val = ffi.new("CLIPSValue *") if clips_val is ffi.NULL else clips_val
 
     if value is not ffi.NULL:
         constructor = CLIPS_VALUES.get(type(value), clips_external_address)
@@ -87,11 +98,35 @@ def multifield_value(env: ffi.CData, values: (list, tuple)) -> ffi.CData:
     if not values:
         return lib.EmptyMultifield(env)
 
+    constructors = [CLIPS_VALUES.get(type(v), clips_external_address)
+                    for v in values]
+
+    # nested sequences are flattened by the builder
+    if multifield_value in constructors:
+        return flat_multifield_value(env, values)
+
+    multifield = lib.CreateMultifield(env, len(values))
+    contents = ffi.cast("CLIPSValue *", multifield.contents)
+
+    for index, (constructor, value) in enumerate(zip(constructors, values)):
+        contents[index].value = constructor(env, value)
+
+    return multifield
+
+
+def flat_multifield_value(env: ffi.CData, values: (list, tuple)) -> ffi.CData:
+    """Convert a Python list or tuple into a CLIPS multifield
+    appending the elements of any nested multifield.
+
+    """
     builder = common.environment_builder(env, 'multifield')
+    element = ffi.new("CLIPSValue *")
 
     lib.MBReset(builder)
     for value in values:
-        lib.MBAppend(builder, clips_value(env, value))
+        constructor = CLIPS_VALUES.get(type(value), clips_external_address)
+        element.value = constructor(env, value)
+        lib.MBAppend(builder, element)
 
     return lib.MBCreate(builder)
 
@@ -127,10 +162,7 @@ PYTHON_VALUES = {common.CLIPSType.FLOAT:
                      ffi.string(v.lexemeValue.contents).decode()),
                  common.CLIPSType.STRING:
                  lambda e, v: ffi.string(v.lexemeValue.contents).decode(),
-                 common.CLIPSType.MULTIFIELD:
-                 lambda e, v: tuple(
-                     python_value(e, v.multifieldValue.contents + i)
-                     for i in range(v.multifieldValue.length)),
+                 common.CLIPSType.MULTIFIELD: python_multifield,
                  common.CLIPSType.FACT_ADDRESS:
                  lambda e, v: new_fact(e, v.factValue),
                  common.CLIPSType.INSTANCE_ADDRESS:
@@ -140,6 +172,8 @@ PYTHON_VALUES = {common.CLIPSType.FLOAT:
                      ffi.string(v.lexemeValue.contents).decode()),
                  common.CLIPSType.EXTERNAL_ADDRESS: python_external_address,
                  common.CLIPSType.VOID: lambda e, v: None}
+# CLIPS types are small contiguous integers, index the converters by them
+PYTHON_VALUES = tuple(PYTHON_VALUES[t] for t in sorted(PYTHON_VALUES))
 
 
 CLIPS_VALUES = {int: lib.CreateInteger,
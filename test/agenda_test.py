@@ -67,6 +67,52 @@ class TestAgenda(unittest.TestCase):
         with self.assertRaises(CLIPSError):
             activation.salience = 10
 
+    def test_agenda_activation_run(self):
+        """Agenda activations are tracked across runs and refreshes."""
+        self.env.build(DEFOTHERRULE)
+        self.env.assert_string('(implied-fact implied-value)')
+
+        fired, pending = tuple(self.env.activations())
+
+        self.env.run(limit=1)
+
+        with self.assertRaises(CLIPSError):
+            fired.salience = 30
+
+        pending.salience = 30
+        self.assertEqual(pending.salience, 30)
+
+        self.env.refresh()
+
+        pending.delete()
+        self.assertFalse(pending in self.env.activations())
+        with self.assertRaises(CLIPSError):
+            pending.delete()
+
+        self.env.find_rule('other-rule-name').refresh()
+
+        activation = tuple(self.env.activations())[0]
+        self.assertEqual(activation.name, 'other-rule-name')
+        activation.delete()
+        self.assertEqual(tuple(self.env.activations()), ())
+
+    def test_agenda_activation_module(self):
+        """Agenda activations follow the current module."""
+        self.env.assert_string('(implied-fact implied-value)')
+
+        activation = tuple(self.env.activations())[0]
+        self.assertEqual(activation.salience, 10)
+
+        self.env.build('(defmodule OTHER)')
+
+        with self.assertRaises(CLIPSError):
+            activation.salience = 20
+
+        self.env.current_module = self.env.find_module('MAIN')
+
+        activation.salience = 20
+        self.assertEqual(activation.salience, 20)
+
     def test_agenda_run(self):
         """Agenda rules are fired on run."""
         self.env.assert_string('(implied-fact implied-value)')
@@ -146,6 +192,18 @@ class TestRules(unittest.TestCase):
         with self.assertRaises(CLIPSError):
             print(rule)
 
+    def test_rule_redefinition(self):
+        """Rule follows the redefinition of its construct."""
+        rule = self.env.find_rule('rule-name')
+        self.assertEqual(str(rule), ' '.join(DEFTEMPLATERULE.split()))
+
+        self.env.build(DEFRULE)
+        self.assertEqual(str(rule), ' '.join(DEFRULE.split()))
+
+        self.env.clear()
+        with self.assertRaises(CLIPSError):
+            print(rule)
+
     def test_rule_matches(self):
         """Partial rule matches."""
         rule = self.env.find_rule('rule-name')
@@ -1,9 +1,11 @@
+import gc
 import os
 import unittest
 from tempfile import mkstemp
 
 from clips import Environment, Symbol, InstanceName
 from clips import CLIPSError, ClassDefaultMode, LoggingRouter
+from clips.common import ENVIRONMENT_DATA
 
 
 DEFCLASSES = [
@@ -140,6 +142,28 @@ class TestClasses(unittest.TestCase):
 
         defclass.undefine()
 
+    def test_class_redefinition(self):
+        """Class follows the redefinition of its construct."""
+        defclass = self.env.find_class('ConcreteClass')
+        self.assertFalse(defclass.abstract)
+
+        self.env.build("(defclass ConcreteClass (is-a USER) (role abstract))")
+        self.assertTrue(defclass.abstract)
+
+        self.env.clear()
+        with self.assertRaises(CLIPSError):
+            print(defclass)
+
+    def test_find_class_undefined(self):
+        """Class lookups follow the Environment changes."""
+        defclass = self.env.find_class('ConcreteClass')
+        self.assertEqual(self.env.find_class('ConcreteClass'), defclass)
+
+        defclass.undefine()
+
+        with self.assertRaises(LookupError):
+            self.env.find_class('ConcreteClass')
+
     def test_slot(self):
         """Slot test."""
         defclass = self.env.find_class('ConcreteClass')
@@ -197,6 +221,20 @@ class TestClasses(unittest.TestCase):
         with self.assertRaises(LookupError):
             self.env.find_instance('test-instance')
 
+    def test_instance_outlives_environment(self):
+        """Instances are safely dropped after their Environment."""
+        env = Environment()
+        env.build('(defclass Concrete (is-a USER))')
+        instance = env.find_class('Concrete').make_instance()
+
+        del env
+        gc.collect()
+
+        self.assertFalse(instance._env in ENVIRONMENT_DATA)
+
+        del instance
+        gc.collect()
+
     def test_make_instance_errors(self):
         """Instance errors."""
         defclass = self.env.find_class('ConcreteClass')
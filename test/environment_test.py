@@ -4,6 +4,7 @@ from tempfile import mkstemp
 
 from clips import CLIPSError
 from clips import Environment, Symbol, LoggingRouter, ImpliedFact, InstanceName
+from clips import Router
 
 DEFRULE_FACT = """
 (defrule fact-rule
@@ -29,6 +30,13 @@ DEFFUNCTION = """
 
 DEFCLASS = """(defclass TEST (is-a USER))"""
 
+DEFUNBOUND = """
+(deffunction unbound-argument ()
+   (bind ?value 1)
+   (bind ?value)
+   (python_method 1 ?value))
+"""
+
 
 def python_function(*value):
     return value
@@ -65,6 +73,23 @@ class ObjectTest:
         self.value = value
 
 
+class ClassRouter(Router):
+    """Router inspecting a Class whenever it is written to."""
+    def __init__(self, defclass):
+        super().__init__('class-router', 30)
+        self.defclass = defclass
+        self.undefined = False
+
+    def query(self, name):
+        return name == 'class-router'
+
+    def write(self, name, message):
+        try:
+            str(self.defclass)
+        except CLIPSError:
+            self.undefined = True
+
+
 class TestEnvironment(unittest.TestCase):
     def setUp(self):
         self.values = []
@@ -108,6 +133,56 @@ class TestEnvironment(unittest.TestCase):
         ret = self.env.eval('(python_types)')
         self.assertEqual(ret, expected)
 
+    def test_eval_python_function_arguments(self):
+        """Python function receives multifields, facts and instances."""
+        fact = self.env.assert_string('(argument-fact)')
+        instance = self.env.find_class('TEST').make_instance('argument')
+
+        ret = self.env.eval('(python_function (create$ 1 2 3))')
+        self.assertEqual(ret, ((1, 2, 3), ))
+
+        ret = self.env.eval(
+            '(python_function (nth$ 1 (find-fact ((?f argument-fact)) TRUE)))')
+        self.assertEqual(ret, (fact, ))
+
+        ret = self.env.eval(
+            '(python_function (instance-address [argument]))')
+        self.assertEqual(ret, (instance, ))
+
+    def test_eval_python_function_no_arguments(self):
+        """Python function is called without arguments."""
+        ret = self.env.eval('(python_function)')
+        self.assertEqual(ret, ())
+
+        ret = self.env.eval('(python-function python_function)')
+        self.assertEqual(ret, ())
+
+        ret = self.env.call('python_function')
+        self.assertEqual(ret, ())
+
+    def test_call_python_function_arguments(self):
+        """Python function receives external addresses."""
+        test_object = ObjectTest(42)
+
+        ret = self.env.call('python_function', test_object, [1, 2])
+
+        self.assertEqual(ret, (test_object, (1, 2)))
+
+    def test_eval_python_function_errors(self):
+        """Invalid Python function calls are reported."""
+        with self.assertRaises(CLIPSError):
+            self.env.eval('(python-function)')
+        with self.assertRaises(CLIPSError):
+            self.env.eval('(python-function 1)')
+        with self.assertRaises(CLIPSError):
+            self.env.eval('(python_method 1 (div 1 0))')
+
+        self.env.build(DEFUNBOUND)
+        with self.assertRaises(CLIPSError):
+            self.env.eval('(unbound-argument)')
+
+        self.assertEqual(self.values, [])
+
     def test_eval_python_error(self):
         """Errors in Python functions are correctly set."""
         self.assertIsNone(self.env.error_state)
@@ -128,6 +203,57 @@ class TestEnvironment(unittest.TestCase):
         self.assertEqual(ret, Symbol('nil'))
         self.assertEqual(self.values, expected)
 
+    def test_eval_python_function_changes(self):
+        """Constructs changed by Python functions are tracked."""
+        def define_template():
+            self.env.build('(deftemplate callback-template (slot value))')
+            self.values.append(self.env.find_template('callback-template'))
+
+        self.env.define_function(define_template,
+                                 name='define-template')
+        self.env.eval('(define-template)')
+
+        template = self.values.pop()
+        self.assertEqual(template, self.env.find_template('callback-template'))
+        self.assertEqual(template.assert_fact(value=1)['value'], 1)
+
+        self.env.reset()
+        self.env.eval('(undeftemplate callback-template)')
+
+        with self.assertRaises(CLIPSError):
+            str(template)
+
+    def test_rule_python_undefined_construct(self):
+        """Constructs undefined before calling Python are detected."""
+        self.env.build('(defclass REMOVED (is-a USER))')
+        self.env.build("""(defrule undefine-rule (undefine-class)
+                          => (undefclass REMOVED) (check-class))""")
+        defclass = self.env.find_class('REMOVED')
+        self.assertTrue('REMOVED' in str(defclass))
+
+        def check_class():
+            try:
+                str(defclass)
+            except CLIPSError:
+                self.values.append('undefined')
+
+        self.env.define_function(check_class, name='check-class')
+        self.env.assert_string('(undefine-class)')
+        self.env.run()
+
+        self.assertEqual(self.values, ['undefined'])
+
+    def test_router_undefined_construct(self):
+        """Constructs undefined before calling a Router are detected."""
+        self.env.build('(defclass REMOVED (is-a USER))')
+        router = ClassRouter(self.env.find_class('REMOVED'))
+        self.env.add_router(router)
+
+        self.env.eval(
+            '(progn (undefclass REMOVED) (printout class-router check))')
+
+        self.assertTrue(router.undefined)
+
     def test_call_python_object(self):
         """Python objects are correctly marshalled."""
         test_object = ObjectTest(42)
@@ -159,6 +285,19 @@ class TestEnvironment(unittest.TestCase):
 
         self.assertTrue(isinstance(self.values[0], ImpliedFact))
 
+    def test_namespace_attributes(self):
+        """Namespace attributes are exposed by the Environment."""
+        self.assertTrue('assert_string' in dir(self.env))
+        self.assertEqual(self.env.find_template.__doc__,
+                         self.env._facts.find_template.__doc__)
+
+        with self.assertRaises(AttributeError):
+            self.env.undefined_attribute
+        with self.assertRaises(AttributeError):
+            self.env.undefined_attribute = None
+        with self.assertRaises(AttributeError):
+            self.env.assert_string = None
+
     def test_batch_star(self):
         """Commands are evaluated from file."""
         with TempFile() as tmp:
@@ -1,8 +1,10 @@
+import gc
 import os
 import unittest
 from tempfile import mkstemp
 
 from clips import Environment, Symbol, CLIPSError, TemplateSlotDefaultType
+from clips.common import ENVIRONMENT_DATA
 
 
 DEFTEMPLATE = """(deftemplate MAIN::template-fact
@@ -16,6 +18,10 @@ DEFFACTS = """(deffacts MAIN::defined-facts
    (template-fact (int 1) (str "a-string")))
 """
 
+DEFMODULE = """(defmodule OTHER)
+(deftemplate OTHER::qualified-fact (slot value))
+"""
+
 IMPL_STR = '(implied-fact 1 2.3 "4" five)'
 IMPL_RPR = 'ImpliedFact: (implied-fact 1 2.3 "4" five)'
 TMPL_STR = '(template-fact (int 1) (float 2.2) (str "4") (symbol five) ' + \
@@ -60,13 +66,56 @@ class TestFacts(unittest.TestCase):
             loaded = self.env.load_facts(tmp.name)
             self.assertEqual(saved, loaded)
 
+    def test_template_facts(self):
+        """Template Facts iteration."""
+        template = self.env.find_template('template-fact')
+        self.assertEqual(list(template.facts()), [])
+
+        fact = template.assert_fact(int=1)
+        self.env.assert_string('(implied-fact)')
+
+        self.assertEqual(list(template.facts()), [fact])
+        self.assertEqual(len(list(self.env.facts())), 2)
+
+    def test_qualified_template(self):
+        """Module qualified Templates survive Environment changes."""
+        self.env.build(DEFMODULE)
+        self.env.current_module = self.env.find_module('MAIN')
+
+        template = self.env.find_template('OTHER::qualified-fact')
+        self.env.reset()
+
+        self.assertEqual(template.module.name, 'OTHER')
+        self.assertTrue('qualified-fact' in str(template))
+
+        fact = template.assert_fact(value=1)
+        self.assertEqual(fact['value'], 1)
+        self.assertEqual(fact.template, template)
+
+    def test_fact_outlives_environment(self):
+        """Facts are safely dropped after their Environment."""
+        env = Environment()
+        fact = env.assert_string('(implied-fact)')
+
+        del env
+        gc.collect()
+
+        self.assertFalse(fact._env in ENVIRONMENT_DATA)
+
+        del fact
+        gc.collect()
+
     def test_implied_fact(self):
         """ImpliedFacts are asserted."""
         expected = (1, 2.3, '4', Symbol('five'))
         fact = self.env.assert_string('(implied-fact 1 2.3 "4" five)')
 
         self.assertEqual(fact[0], 1)
+        self.assertEqual(fact[-1], Symbol('five'))
+        self.assertEqual(fact[1:3], (2.3, '4'))
         self.assertEqual(len(fact), 4)
+        with self.assertRaises(IndexError):
+            fact[4]
         self.assertEqual(fact.index, 1)
         self.assertEqual(tuple(fact), expected)
         self.assertEqual(str(fact), IMPL_STR)
@@ -10,6 +10,12 @@ DEFGLOBAL = """
 """
 
 DEFMODULE = """(defmodule TEST)"""
+DEFCLASSES = """
+(defmodule FIRST)
+(defclass FIRST::Shared (is-a USER))
+(defmodule SECOND)
+(defclass SECOND::Shared (is-a USER))
+"""
 
 
 class TestModules(unittest.TestCase):
@@ -39,6 +45,22 @@ class TestModules(unittest.TestCase):
         with self.assertRaises(LookupError):
             self.env.find_module("NONEXISTING")
 
+    def test_current_module_lookups(self):
+        """Lookups follow the current module."""
+        self.env.build(DEFCLASSES)
+
+        self.env.current_module = self.env.find_module('FIRST')
+        self.assertEqual(
+            self.env.find_class('Shared').module.name, 'FIRST')
+
+        self.env.current_module = self.env.find_module('SECOND')
+        self.assertEqual(
+            self.env.find_class('Shared').module.name, 'SECOND')
+
+        self.env.current_module = self.env.find_module('MAIN')
+        with self.assertRaises(LookupError):
+            self.env.find_class('Shared')
+
     def test_global(self):
         """Defglobal object test."""
         glbl = self.env.find_global("b")